@@ -2,4 +2,9 @@
 BetterFinder - Schnelle Dateisuche für Windows
 """
 
-__version__ = "0.1.0" 
\ No newline at end of file
+import os
+
+__version__ = "0.1.0"
+
+# Mit BETTERFINDER_DEBUG=1 werden bei behandelten Fehlern vollständige Tracebacks ausgegeben
+DEBUG = os.environ.get("BETTERFINDER_DEBUG") == "1"
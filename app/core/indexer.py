@@ -14,10 +14,11 @@ import threading
 import logging
 import queue
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Tuple
+from typing import List, Dict, Set, Optional, Tuple, Callable
 import win32file
 import win32con
 import win32api
+import win32process
 import pywintypes
 
 class FileSystemIndexer:
@@ -38,6 +39,7 @@ class FileSystemIndexer:
         self.index_thread = None
         self.drives = []
         self.file_queue = queue.Queue()
+        self.progress_cb = None  # Wird mit der Anzahl indizierter Dateien aufgerufen
         self.db_lock = threading.Lock()  # Lock für Datenbankzugriff
         self.setup_database()
         
@@ -103,14 +105,21 @@ class FileSystemIndexer:
             bitmask >>= 1
         return drives
     
-    def start_indexing(self):
-        """Startet den Indizierungsprozess für alle verfügbaren Laufwerke"""
+    def start_indexing(self, progress_cb: Optional[Callable[[int], None]] = None):
+        """
+        Startet den Indizierungsprozess für alle verfügbaren Laufwerke
+        
+        Args:
+            progress_cb: Optionaler Callback, der nach jedem Batch mit der Anzahl
+                         bisher indizierter Dateien aufgerufen wird
+        """
         # Zuerst prüfen, ob bereits ein Indizierungsprozess läuft
         if self.index_thread and self.index_thread.is_alive():
             print("Indizierung läuft bereits, bitte warten...")
             return
             
         self.drives = self.get_drives()
+        self.progress_cb = progress_cb
         
         # SQLite-Operationen müssen im selben Thread erfolgen
         self.index_thread = threading.Thread(target=self._indexing_worker)
@@ -132,6 +141,10 @@ class FileSystemIndexer:
         # Signal zum Ende des Scannings
         self.file_queue.put(None)
         
+        # Warten, bis alle Einträge der Warteschlange geschrieben sind, damit die
+        # Indizierung erst danach als abgeschlossen gilt
+        self.index_thread.join()
+        
         # Nach der Indizierung Überwachung starten
         self.start_watching()
     
@@ -142,6 +155,7 @@ class FileSystemIndexer:
         Args:
             directory: Zu scannendes Verzeichnis
         """
+        self._lower_thread_priority()
         try:
             for root, dirs, files in os.walk(directory):
                 # Dateien zur Warteschlange hinzufügen
@@ -170,6 +184,7 @@ class FileSystemIndexer:
     
     def _indexing_worker(self):
         """Thread-Methode für die Indexierung der Dateien"""
+        self._lower_thread_priority()
         # Eigene Datenbankverbindung für diesen Thread erstellen
         try:
             thread_conn = sqlite3.connect(self.db_path, timeout=30.0)
@@ -181,6 +196,7 @@ class FileSystemIndexer:
             
             batch = []
             batch_size = 1000
+            indexed_count = 0
             
             while True:
                 try:
@@ -202,6 +218,8 @@ class FileSystemIndexer:
                     # Führe Batch-Einfügung durch, wenn die Batch-Größe erreicht ist
                     if len(batch) >= batch_size:
                         self._execute_batch_insert(thread_conn, thread_cursor, batch)
+                        indexed_count += len(batch)
+                        self._report_progress(indexed_count)
                         batch = []
                     
                     self.file_queue.task_done()
@@ -209,6 +227,8 @@ class FileSystemIndexer:
                     # Timeout bei leerer Queue - prüfen, ob noch Dateien zum Einfügen
                     if batch:
                         self._execute_batch_insert(thread_conn, thread_cursor, batch)
+                        indexed_count += len(batch)
+                        self._report_progress(indexed_count)
                         batch = []
                     else:
                         # Keine Dateien mehr, wir sind fertig
@@ -221,12 +241,36 @@ class FileSystemIndexer:
             # Restliche Einträge einfügen
             if batch:
                 self._execute_batch_insert(thread_conn, thread_cursor, batch)
+                indexed_count += len(batch)
+                self._report_progress(indexed_count)
             
             # Datenbank schließen
             thread_conn.close()
         except sqlite3.Error as e:
             print(f"Schwerwiegender Datenbankfehler beim Indizieren: {e}")
     
+    def _report_progress(self, count: int):
+        """
+        Meldet den Fortschritt an den Callback von start_indexing
+        
+        Args:
+            count: Anzahl bisher indizierter Dateien
+        """
+        if self.progress_cb:
+            try:
+                self.progress_cb(count)
+            except Exception as e:
+                print(f"Fehler im Fortschritts-Callback: {e}")
+    
+    @staticmethod
+    def _lower_thread_priority():
+        """Senkt die Priorität des aktuellen Threads, damit die Suche flüssig bleibt"""
+        try:
+            win32process.SetThreadPriority(win32api.GetCurrentThread(),
+                                           win32process.THREAD_PRIORITY_BELOW_NORMAL)
+        except pywintypes.error:
+            pass
+    
     def _execute_batch_insert(self, conn, cursor, batch):
         """
         Führt eine Batch-Einfügung in die Datenbank durch
@@ -46,7 +46,12 @@ class SearchEngine:
                     # Pragmas für bessere Nebenläufigkeit
                     self.local.conn.execute("PRAGMA journal_mode=WAL")  # Write-Ahead Logging
                     self.local.conn.execute("PRAGMA busy_timeout=5000")  # 5 Sekunden bei Blockierung warten
+                    # Lesezugriffe über den Page-Cache des Betriebssystems und einen großen SQLite-Cache
+                    self.local.conn.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped I/O
+                    self.local.conn.execute("PRAGMA cache_size=-65536")  # 64 MB Seiten-Cache
+                    self.local.conn.execute("PRAGMA temp_store=MEMORY")  # Temporäre Tabellen im Speicher
                     self.local.cursor = self.local.conn.cursor()
+                    self._install_progress_handler(self.local.conn)
                 except sqlite3.Error as e:
                     print(f"Fehler beim Verbinden zur Datenbank: {e}")
                     # Fallback auf eine In-Memory-Datenbank, wenn die echte Datenbank nicht zugänglich ist
@@ -56,6 +61,40 @@ class SearchEngine:
         
         return self.local.conn, self.local.cursor
     
+    def register_cancel_token(self, token_holder, interval: int = 1024):
+        """
+        Registriert ein Abbruch-Token für die Abfragen des aktuellen Threads
+        
+        SQLite prüft das Token alle `interval` VM-Instruktionen und bricht die
+        laufende Abfrage ab, sobald `token_holder.cancelled` wahr ist.
+        
+        Args:
+            token_holder: Objekt mit einem Attribut `cancelled`
+            interval: Anzahl der SQLite-VM-Instruktionen zwischen zwei Prüfungen
+        """
+        self.local.cancel_token = token_holder
+        self.local.cancel_interval = interval
+        conn, _ = self._get_connection()
+        self._install_progress_handler(conn)
+    
+    def _install_progress_handler(self, conn):
+        """
+        Installiert den Abbruch-Handler des aktuellen Threads auf einer Verbindung
+        
+        Args:
+            conn: SQLite-Verbindung
+        """
+        token_holder = getattr(self.local, 'cancel_token', None)
+        if token_holder is None:
+            return
+        conn.set_progress_handler(lambda: 1 if token_holder.cancelled else 0,
+                                  self.local.cancel_interval)
+    
+    def _is_cancelled(self) -> bool:
+        """Prüft, ob die Abfrage des aktuellen Threads abgebrochen wurde"""
+        token_holder = getattr(self.local, 'cancel_token', None)
+        return token_holder is not None and token_holder.cancelled
+    
     def close(self):
         """Datenbankverbindung schließen"""
         if hasattr(self.local, 'conn') and self.local.conn:
@@ -86,7 +125,9 @@ class SearchEngine:
             else:
                 return self._simple_search(query, file_type, max_results)
         except sqlite3.Error as e:
-            print(f"Datenbankfehler bei der Suche: {e}")
+            # Ein abgebrochener Suchvorgang ist kein Fehler
+            if not self._is_cancelled():
+                print(f"Datenbankfehler bei der Suche: {e}")
             return []  # Leere Liste zurückgeben bei Fehler
     
     def _simple_search(self, query: str, file_type: Optional[str], max_results: int) -> List[Dict]:
@@ -151,6 +192,9 @@ class SearchEngine:
                     'full_path': os.path.join(row['path'], row['filename'])
                 })
         except Exception as e:
+            # Ein abgebrochener Suchvorgang ist kein Fehler, Teilergebnisse werden verworfen
+            if self._is_cancelled():
+                return []
             print(f"Fehler beim Verarbeiten der Suchergebnisse: {e}")
             
         return results
@@ -207,6 +251,9 @@ class SearchEngine:
                     'full_path': os.path.join(row['path'], row['filename'])
                 })
         except Exception as e:
+            # Ein abgebrochener Suchvorgang ist kein Fehler, Teilergebnisse werden verworfen
+            if self._is_cancelled():
+                return []
             print(f"Fehler beim Verarbeiten der Suchergebnisse: {e}")
             
         return results
@@ -341,13 +388,13 @@ class SearchEngine:
         
         return "", []
     
-    def search_by_regex(self, regex_pattern: str, file_type: Optional[str] = None, 
+    def search_by_regex(self, regex_pattern: Union[str, re.Pattern], file_type: Optional[str] = None, 
                         max_results: int = 1000) -> List[Dict]:
         """
         Sucht nach Dateien mit einem regulären Ausdruck
         
         Args:
-            regex_pattern: Regulärer Ausdruck
+            regex_pattern: Regulärer Ausdruck, als String oder bereits kompiliertes Muster
             file_type: Optionaler Dateitypfilter
             max_results: Maximale Anzahl an Ergebnissen
             
@@ -389,7 +436,10 @@ class SearchEngine:
                     raise  # Andere Fehler oder zu viele Versuche
         
         results = []
-        pattern = re.compile(regex_pattern, re.IGNORECASE)
+        if isinstance(regex_pattern, re.Pattern):
+            pattern = regex_pattern
+        else:
+            pattern = re.compile(regex_pattern, re.IGNORECASE)
         
         try:
             for row in cursor:
@@ -406,6 +456,9 @@ class SearchEngine:
                     if len(results) >= max_results:
                         break
         except Exception as e:
+            # Ein abgebrochener Suchvorgang ist kein Fehler, Teilergebnisse werden verworfen
+            if self._is_cancelled():
+                return []
             print(f"Fehler beim Verarbeiten der Regex-Ergebnisse: {e}")
         
         return results 
\ No newline at end of file
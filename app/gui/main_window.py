@@ -7,27 +7,45 @@ This module defines the main window of the application with:
 """
 
 import os
+import re
 import sys
+import ast
+import math
+import operator
 import time
-import webbrowser
-import traceback
+import functools
+import logging
+import importlib.resources
+import collections
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Optional
 
 from PyQt5.QtWidgets import (
     QMainWindow, QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-    QLineEdit, QPushButton, QTableWidget, QTableWidgetItem, QLabel,
-    QComboBox, QStatusBar, QMenu, QAction, QFileDialog, QMessageBox,
-    QHeaderView, QSystemTrayIcon, QSplitter, QTabWidget, QCheckBox,
-    QToolBar, QShortcut, QFrame, QGridLayout, QListWidget, QListWidgetItem,
-    QGraphicsDropShadowEffect, QDialog, QDesktopWidget, QGroupBox, QSpinBox
+    QLineEdit, QLabel, QMenu, QAction, QMessageBox,
+    QSystemTrayIcon, QShortcut, QFrame, QDialog, QDesktopWidget,
+    QListView, QStyledItemDelegate, QStyleOptionViewItem, qDrawBorderPixmap
+)
+from PyQt5.QtCore import (
+    Qt, QTimer, QThread, pyqtSignal, pyqtSlot, QSettings, QRect, QPropertyAnimation, QEasingCurve,
+    QAbstractNativeEventFilter, QMetaObject, QStandardPaths, QObject, Q_ARG,
+    QAbstractListModel, QModelIndex, QMargins, QRunnable, QThreadPool
+)
+from PyQt5.QtGui import (
+    QIcon, QPixmap, QKeySequence, QFont, QColor, QPalette, QFontMetrics, QPainter
 )
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal, QSettings, QSize, QRect, QPoint, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QIcon, QPixmap, QKeySequence, QFont, QColor, QPalette, QFontMetrics, QRegion, QPainterPath
 
 from app.core.indexer import FileSystemIndexer
 from app.core.search_engine import SearchEngine
-from app.utils.file_utils import get_file_size_str, get_file_date_str, open_file, open_containing_folder
+from app.utils.file_utils import open_file
+from app.gui.settings_dialog import SettingsDialog, read_excluded_paths
+
+if sys.platform == "win32":
+    import ctypes
+    import ctypes.wintypes
+    import winreg
+
+logger = logging.getLogger(__name__)
 
 # Constant definitions for styling - MODERN UI UPGRADE
 BACKGROUND_COLOR = "#1a1a1a"  # Darker, more modern
@@ -44,6 +62,29 @@ BORDER_LIGHT = "#606060"  # Lighter border for hover states
 SHADOW_COLOR = "rgba(0, 0, 0, 0.3)"
 GLASS_BACKGROUND = "rgba(45, 45, 45, 0.8)"  # Glassmorphism effect
 
+# Parsed colors for the dark palette, so each hex string is only parsed once
+_BACKGROUND_QCOLOR = QColor(BACKGROUND_COLOR)
+_BACKGROUND_SECONDARY_QCOLOR = QColor(BACKGROUND_SECONDARY)
+_TEXT_QCOLOR = QColor(TEXT_COLOR)
+_ACCENT_QCOLOR = QColor(ACCENT_COLOR)
+
+# Dark palette roles, applied once in main()
+_DARK_PALETTE_COLORS = (
+    (QPalette.Window, _BACKGROUND_QCOLOR),
+    (QPalette.WindowText, _TEXT_QCOLOR),
+    (QPalette.Base, _BACKGROUND_SECONDARY_QCOLOR),
+    (QPalette.AlternateBase, _BACKGROUND_QCOLOR),
+    (QPalette.ToolTipBase, _TEXT_QCOLOR),
+    (QPalette.ToolTipText, _TEXT_QCOLOR),
+    (QPalette.Text, _TEXT_QCOLOR),
+    (QPalette.Button, _BACKGROUND_SECONDARY_QCOLOR),
+    (QPalette.ButtonText, _TEXT_QCOLOR),
+    (QPalette.BrightText, QColor(Qt.red)),
+    (QPalette.Link, _ACCENT_QCOLOR),
+    (QPalette.Highlight, _ACCENT_QCOLOR),
+    (QPalette.HighlightedText, QColor(Qt.white)),
+)
+
 # Animation constants
 ANIMATION_DURATION = 200  # ms
 HOVER_ANIMATION_DURATION = 150  # ms
@@ -61,6 +102,181 @@ SPACING_LARGE = 24
 BORDER_RADIUS = 12
 BORDER_RADIUS_LARGE = 20
 
+# Stylesheets, formatted once at import
+_SEARCH_CONTAINER_QSS = f"""
+    #searchContainer {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {BACKGROUND_SECONDARY}, stop:1 {BACKGROUND_COLOR});
+        border-radius: {BORDER_RADIUS_LARGE}px;
+        border: 2px solid {BORDER_COLOR};
+        padding: 0px;
+    }}
+    #searchContainer:focus-within {{
+        border: 2px solid {ACCENT_COLOR};
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {BACKGROUND_SECONDARY}, stop:1 #333333);
+    }}
+"""
+
+_SEARCH_ICON_QSS = f"""
+    QLabel {{
+        color: {TEXT_SECONDARY};
+        font-size: {FONT_SIZE_LARGE};
+        padding: 0px 8px 0px 0px;
+    }}
+"""
+
+_SEARCH_BOX_QSS = f"""
+    QLineEdit {{
+        background-color: transparent;
+        color: {TEXT_COLOR};
+        border: none;
+        font-family: {FONT_FAMILY};
+        font-size: {FONT_SIZE_LARGE};
+        font-weight: 400;
+        padding: 4px;
+    }}
+    QLineEdit::placeholder {{
+        color: {TEXT_SECONDARY};
+        font-style: italic;
+    }}
+"""
+
+_RESULTS_LIST_QSS = f"""
+    #resultsList {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {BACKGROUND_SECONDARY}, stop:1 {BACKGROUND_COLOR});
+        color: {TEXT_COLOR};
+        border: none;
+        border-radius: {BORDER_RADIUS_LARGE}px;
+        padding: {SPACING_MEDIUM}px;
+        font-family: {FONT_FAMILY};
+        selection-background-color: transparent;
+    }}
+    QListView::item {{
+        border-radius: {BORDER_RADIUS}px;
+        padding: {SPACING_MEDIUM}px {SPACING_LARGE}px;
+        margin-bottom: 6px;
+        min-height: 50px;
+        border-left: 3px solid transparent;
+        font-size: {FONT_SIZE_MEDIUM};
+        background: transparent;
+    }}
+    QListView::item:selected {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 {ACCENT_COLOR}, stop:1 {ACCENT_HOVER});
+        color: white;
+        border-left: 3px solid white;
+        font-weight: 500;
+    }}
+    QListView::item:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 {BACKGROUND_SECONDARY}, stop:1 rgba(45, 45, 45, 0.8));
+        border-left: 3px solid {ACCENT_COLOR};
+    }}
+    QListView::item:selected:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 {ACCENT_HOVER}, stop:1 {ACCENT_COLOR});
+    }}
+    QScrollBar:vertical {{
+        border: none;
+        background: {BACKGROUND_COLOR};
+        width: 10px;
+        margin: {SPACING_MEDIUM}px 3px {SPACING_MEDIUM}px 3px;
+        border-radius: 5px;
+    }}
+    QScrollBar::handle:vertical {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 {BORDER_COLOR}, stop:1 {BORDER_LIGHT});
+        min-height: 30px;
+        border-radius: 5px;
+    }}
+    QScrollBar::handle:vertical:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 {ACCENT_COLOR}, stop:1 {ACCENT_HOVER});
+    }}
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+        border: none;
+        background: none;
+        height: 0px;
+    }}
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
+        background: none;
+    }}
+"""
+
+_CONTENT_WIDGET_QSS = f"""
+    #contentWidget {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {GLASS_BACKGROUND}, stop:1 {BACKGROUND_COLOR});
+        border-radius: {BORDER_RADIUS_LARGE * 2}px;
+        border: 2px solid {BORDER_COLOR};
+        backdrop-filter: blur(20px);
+    }}
+"""
+
+# Number of queries whose formatted results are kept for reuse
+RESULT_CACHE_SIZE = 64
+# Number of result rows shown at once, more are fetched while scrolling
+RESULT_PAGE_SIZE = 200
+# Maximum number of results requested from the search engine
+SEARCH_RESULT_LIMIT = 1000
+
+# Icon mapping for common file types (by lowercase extension)
+_ICON_MAP = {
+    # Documents
+    'pdf': '📕', 'doc': '📘', 'docx': '📘', 'txt': '📄', 'rtf': '📄',
+    'odt': '📄', 'pages': '📄',
+    
+    # Spreadsheets
+    'xls': '📊', 'xlsx': '📊', 'csv': '📊', 'ods': '📊', 'numbers': '📊',
+    
+    # Presentations
+    'ppt': '📽️', 'pptx': '📽️', 'odp': '📽️', 'key': '📽️',
+    
+    # Images
+    'jpg': '🖼️', 'jpeg': '🖼️', 'png': '🖼️', 'gif': '🖼️', 'bmp': '🖼️',
+    'svg': '🖼️', 'ico': '🖼️', 'tiff': '🖼️', 'webp': '🖼️',
+    
+    # Videos
+    'mp4': '🎬', 'avi': '🎬', 'mkv': '🎬', 'mov': '🎬', 'wmv': '🎬',
+    'flv': '🎬', 'webm': '🎬', 'm4v': '🎬',
+    
+    # Audio
+    'mp3': '🎵', 'wav': '🎵', 'flac': '🎵', 'aac': '🎵', 'ogg': '🎵',
+    'wma': '🎵', 'm4a': '🎵',
+    
+    # Archives
+    'zip': '📦', 'rar': '📦', '7z': '📦', 'tar': '📦', 'gz': '📦',
+    'bz2': '📦', 'xz': '📦',
+    
+    # Code files
+    'py': '🐍', 'js': '📜', 'html': '🌐', 'css': '🎨', 'cpp': '⚙️',
+    'c': '⚙️', 'java': '☕', 'php': '🐘', 'rb': '💎', 'go': '🐹',
+    'rs': '🦀', 'swift': '🦉', 'kt': '🎯', 'ts': '📜',
+    
+    # Executables
+    'exe': '⚡', 'msi': '⚡', 'app': '⚡', 'deb': '⚡', 'rpm': '⚡',
+    
+    # Folders (special case)
+    'folder': '📁'
+}
+
+# Global hotkey (Windows RegisterHotKey)
+WM_HOTKEY = 0x0312
+MOD_CONTROL = 0x0002
+VK_SPACE = 0x20
+HOTKEY_ID = 1
+
+# Registry key for programs started at logon of the current user
+AUTOSTART_RUN_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
+# Startup folder files written by older versions for autostart
+_STARTUP_DIR = os.path.join(os.getenv('APPDATA') or '', 'Microsoft', 'Windows', 'Start Menu', 'Programs', 'Startup')
+_LEGACY_STARTUP_FILES = (
+    os.path.join(_STARTUP_DIR, 'BetterFinder.lnk'),
+    os.path.join(_STARTUP_DIR, 'BetterFinder.bat'),
+)
+
 # Command prefixes
 COMMANDS = {
     "=": "Calculates mathematical expressions",
@@ -70,92 +286,237 @@ COMMANDS = {
     ".": "Searches for programs"
 }
 
-class SearchThread(QThread):
-    """Thread for searching, to avoid blocking the UI"""
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str) -> re.Pattern:
+    """Compiles a regex search pattern, reusing patterns typed before"""
+    return re.compile(pattern, re.IGNORECASE)
+
+# Operators, names and functions allowed in "=" calculations
+_CALC_BINARY_OPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod, ast.Pow: operator.pow
+}
+_CALC_UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+_CALC_NAMES = {'pi': math.pi, 'e': math.e, 'tau': math.tau}
+_CALC_FUNCTIONS = {
+    name: getattr(math, name) for name in (
+        'sqrt', 'sin', 'cos', 'tan', 'asin', 'acos', 'atan', 'log', 'log10', 'log2',
+        'exp', 'floor', 'ceil', 'degrees', 'radians'
+    )
+}
+_CALC_FUNCTIONS.update(abs=abs, round=round)
+# Limit for the number of bits of a power, to keep typing "9**9**9" from freezing the UI;
+# 14000 bits stay below the 4300 digits Python will still convert to a string
+_CALC_MAX_POW_BITS = 14000
+# Longer expressions are rejected before parsing; deeply nested input makes ast.parse
+# raise MemoryError, and the calculation runs in the UI thread
+_CALC_MAX_LENGTH = 256
+
+@functools.lru_cache(maxsize=512)
+def _calc(expression: str):
+    """
+    Evaluates a mathematical expression without using eval
+    
+    Only numbers, arithmetic operators and the whitelisted names and math
+    functions are allowed.
+    
+    Raises:
+        ValueError: If the expression contains anything else
+        SyntaxError: If the expression cannot be parsed
+    """
+    if len(expression) > _CALC_MAX_LENGTH:
+        raise ValueError("Expression too long")
+    return _calc_node(ast.parse(expression, mode='eval').body)
+
+def _calc_node(node):
+    """Evaluates a single node of a calculation expression"""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _CALC_BINARY_OPS:
+        left = _calc_node(node.left)
+        right = _calc_node(node.right)
+        if isinstance(node.op, ast.Pow) and isinstance(left, int) and isinstance(right, int):
+            if max(left.bit_length(), 1) * abs(right) > _CALC_MAX_POW_BITS:
+                raise ValueError("Result too large")
+        return _CALC_BINARY_OPS[type(node.op)](left, right)
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _CALC_UNARY_OPS:
+        return _CALC_UNARY_OPS[type(node.op)](_calc_node(node.operand))
+    if isinstance(node, ast.Name) and node.id in _CALC_NAMES:
+        return _CALC_NAMES[node.id]
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == 'math':
+        # math.pi etc.
+        if node.attr in _CALC_NAMES:
+            return _CALC_NAMES[node.attr]
+    if isinstance(node, ast.Call) and not node.keywords:
+        func = node.func
+        if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) and func.value.id == 'math':
+            name = func.attr
+        elif isinstance(func, ast.Name):
+            name = func.id
+        else:
+            name = None
+        if name in _CALC_FUNCTIONS:
+            return _CALC_FUNCTIONS[name](*[_calc_node(arg) for arg in node.args])
+    raise ValueError("Unsupported expression")
+
+@functools.lru_cache(maxsize=1)
+def _app_icon() -> QIcon:
+    """Loads the BetterFinder icon from the package resources once"""
+    pixmap = QPixmap()
+    try:
+        data = importlib.resources.files("app").joinpath("resources/BetterFinder-Icon.png").read_bytes()
+        pixmap.loadFromData(data)
+    except OSError as e:
+        logger.warning("Error loading BetterFinder icon: %s", e)
+    
+    if pixmap.isNull():
+        # Fallback: Use system icon
+        logger.debug("Could not load BetterFinder icon, use system icon as fallback")
+        style = QApplication.style()
+        return style.standardIcon(style.SP_DialogHelpButton)
+    return QIcon(pixmap)
+
+# Width of the transparent margin around the content that holds the shadow
+SHADOW_MARGIN = 20
+SHADOW_OFFSET = 5
+
+@functools.lru_cache()
+def _shadow_pixmap() -> QPixmap:
+    """
+    Renders the drop shadow once as a small 9-slice pixmap.
+    
+    Stacked translucent rounded rectangles approximate the blur of the former
+    QGraphicsDropShadowEffect without re-blurring the window on every repaint.
+    """
+    radius = BORDER_RADIUS_LARGE * 2
+    size = 2 * (SHADOW_MARGIN + radius) + 1
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(0, 0, 0, 12))
+    for inset in range(SHADOW_MARGIN):
+        rect = QRect(inset, inset, size - 2 * inset, size - 2 * inset)
+        painter.drawRoundedRect(rect, radius + SHADOW_MARGIN - inset, radius + SHADOW_MARGIN - inset)
+    painter.end()
+    return pixmap
+
+@functools.lru_cache(maxsize=4096)
+def _path_line(path: str) -> str:
+    """Formats the folder line of a result row; results often share folders"""
+    # Truncate long paths for better readability
+    if len(path) > 50:
+        path = "..." + path[-47:]
+    return f"\n    📁 {path}"
+
+# SQLite's LIKE only ignores the case of ASCII letters, "Ä" and "ä" stay different
+_ASCII_LOWER = str.maketrans(
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'
+)
+
+def _is_plain_query(query: str) -> bool:
+    """
+    Checks if a query is a plain substring search
+    
+    Plain queries are sent to the database as LIKE '%query%', so the results of
+    a longer query are exactly the earlier results whose filename contains it.
+    LIKE wildcards, operators, regex and command prefixes break that rule.
+    """
+    if query.startswith(('regex:', '@', '=')):
+        return False
+    if any(op in query for op in ('AND', 'OR', 'NOT')):
+        return False
+    return not any(char in query for char in '*?%_')
+
+class SearchWorker(QObject):
+    """Worker that performs searches in a persistent background thread"""
     
-    # Signal that returns the search results
-    results_ready = pyqtSignal(list)
+    # Signal that returns the search results and the token of the search
+    results_ready = pyqtSignal(list, int)
     # Signal for errors
     error_occurred = pyqtSignal(str)
     
-    def __init__(self, search_engine: SearchEngine, query: str, file_type: Optional[str] = None):
+    def __init__(self, search_engine: SearchEngine):
         """
-        Initializes the search thread
+        Initializes the search worker
         
         Args:
             search_engine: The search engine
-            query: The search query
-            file_type: Optional file type filter
         """
         super().__init__()
         self.search_engine = search_engine
-        self.query = query
-        self.file_type = file_type
-        self.stop_requested = False
+        # Token of the most recent search request, set from the GUI thread.
+        # Searches with an older token are outdated and get cancelled.
+        self.current_token = 0
+        # Token of the search currently running in the worker thread
+        self._active_token = 0
+        self._cancel_token_registered = False
     
-    def run(self):
-        """Performs the search - IMPROVED WITH BETTER CANCELLATION"""
+    @property
+    def cancelled(self) -> bool:
+        """Whether the running search is outdated, checked by SQLite while a query runs"""
+        return self._active_token != self.current_token
+    
+    def is_cancelled(self, token: int) -> bool:
+        """Checks whether a newer search has been requested"""
+        return token != self.current_token
+    
+    @pyqtSlot(str, int)
+    def do_search(self, query: str, token: int):
+        """
+        Performs a search
+        
+        Args:
+            query: The search query
+            token: Token identifying this search request
+        """
         try:
+            self._active_token = token
+            if not self._cancel_token_registered:
+                # The database connection is per thread, so register from the worker thread
+                self.search_engine.register_cancel_token(self)
+                self._cancel_token_registered = True
+            
             # Early check for cancellation
-            if self.stop_requested:
-                print(f"Search cancelled before start: {self.query}")
+            if self.is_cancelled(token):
+                logger.debug("Search cancelled before start: %s", query)
                 return
                 
-            print(f"Starting search for: '{self.query}'")
+            logger.debug("Starting search for: '%s'", query)
             
             # Check if it's a regular expression
-            if self.query.startswith('regex:'):
-                if self.stop_requested:
-                    return
-                regex_pattern = self.query[6:].strip()
-                results = self.search_engine.search_by_regex(regex_pattern, self.file_type)
-            # Check for command prefixes
-            elif self.query.startswith('='):
-                # Mathematical expression
-                try:
-                    expression = self.query[1:].strip()
-                    result = eval(expression, {"__builtins__": {}}, {})
-                    results = [{"filename": f"{expression} = {result}", "path": "Calculation", 
-                              "size": 0, "last_modified": datetime.now(), "full_path": str(result),
-                              "type": "calculation"}]
-                except:
-                    results = []
-            elif self.query.startswith('@'):
-                # Show settings
-                cmd = self.query[1:].strip().lower()
-                results = [{"filename": "Open Settings", "path": "BetterFinder", 
-                          "size": 0, "last_modified": datetime.now(), "full_path": "settings",
-                          "type": "command"}]
+            if query.startswith('regex:'):
+                pattern = _compile(query[6:].strip())
+                results = self.search_engine.search_by_regex(pattern)
             else:
                 # Check for cancellation before expensive search
-                if self.stop_requested:
-                    print(f"Search cancelled before engine call: {self.query}")
+                if self.is_cancelled(token):
+                    logger.debug("Search cancelled before engine call: %s", query)
                     return
-                results = self.search_engine.search(self.query, self.file_type)
+                results = self.search_engine.search(query, max_results=SEARCH_RESULT_LIMIT)
             
             # Final check for cancellation before emitting results
-            if not self.stop_requested:
-                print(f"Search completed for '{self.query}': {len(results)} results")
-                self.results_ready.emit(results)
+            if not self.is_cancelled(token):
+                logger.debug("Search completed for '%s': %d results", query, len(results))
+                self.results_ready.emit(results, token)
             else:
-                print(f"Search cancelled after completion: {self.query}")
+                logger.debug("Search cancelled after completion: %s", query)
                 
         except Exception as e:
             # Send error signal if no cancellation was requested
-            if not self.stop_requested:
+            if not self.is_cancelled(token):
                 error_msg = f"Search error: {str(e)}"
-                print(f"Search error for '{self.query}': {error_msg}")
+                logger.warning("Search error for '%s': %s", query, error_msg)
                 self.error_occurred.emit(error_msg)
                 # Return empty results list
-                self.results_ready.emit([])
+                self.results_ready.emit([], token)
             else:
-                print(f"Search cancelled due to error: {self.query}")
-            # Output complete error info in terminal
-            traceback.print_exc()
-    
-    def stop(self):
-        """Requests thread cancellation"""
-        self.stop_requested = True
+                logger.debug("Search cancelled due to error: %s", query)
+            # Full traceback only with debug logging enabled
+            logger.debug("Search error details", exc_info=True)
 
 class IndexingThread(QThread):
     """Thread for indexing the file system"""
@@ -181,7 +542,7 @@ class IndexingThread(QThread):
         """Performs the indexing"""
         try:
             self.progress.emit("Indexing started...")
-            self.indexer.start_indexing()
+            self.indexer.start_indexing(progress_cb=self.report_progress)
             self.progress.emit("Indexing completed.")
             self.finished_indexing.emit()
         except Exception as e:
@@ -191,7 +552,39 @@ class IndexingThread(QThread):
             self.progress.emit("Indexing failed.")
             # Output complete error info in terminal
             print(f"Indexing error: {e}")
-            traceback.print_exc()
+            logger.debug("Indexing error details", exc_info=True)
+    
+    def report_progress(self, count: int):
+        """
+        Forwards the number of indexed files as progress message
+        
+        Args:
+            count: Number of files indexed so far
+        """
+        self.progress.emit(f"Indexing... {count} files indexed")
+
+class GlobalHotkeyFilter(QAbstractNativeEventFilter):
+    """Native event filter that invokes a slot when the global hotkey is pressed"""
+    
+    def __init__(self, receiver, slot_name: str):
+        """
+        Initializes the hotkey filter
+        
+        Args:
+            receiver: Object that owns the slot
+            slot_name: Name of the slot to invoke on WM_HOTKEY
+        """
+        super().__init__()
+        self.receiver = receiver
+        self.slot_name = slot_name
+    
+    def nativeEventFilter(self, event_type, message):
+        if event_type == b"windows_generic_MSG":
+            msg = ctypes.wintypes.MSG.from_address(int(message))
+            if msg.message == WM_HOTKEY and msg.wParam == HOTKEY_ID:
+                QMetaObject.invokeMethod(self.receiver, self.slot_name, Qt.QueuedConnection)
+                return True, 0
+        return False, 0
 
 class SpotlightStyleSearchBar(QWidget):
     """Spotlight-like search bar"""
@@ -210,20 +603,7 @@ class SpotlightStyleSearchBar(QWidget):
         # Search field container for radius effect - MODERN UPGRADE
         search_container = QWidget()
         search_container.setObjectName("searchContainer")
-        search_container.setStyleSheet(f"""
-            #searchContainer {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {BACKGROUND_SECONDARY}, stop:1 {BACKGROUND_COLOR});
-                border-radius: {BORDER_RADIUS_LARGE}px;
-                border: 2px solid {BORDER_COLOR};
-                padding: 0px;
-            }}
-            #searchContainer:focus-within {{
-                border: 2px solid {ACCENT_COLOR};
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {BACKGROUND_SECONDARY}, stop:1 #333333);
-            }}
-        """)
+        search_container.setStyleSheet(_SEARCH_CONTAINER_QSS)
         
         # Layout for the container
         container_layout = QHBoxLayout(search_container)
@@ -231,13 +611,7 @@ class SpotlightStyleSearchBar(QWidget):
         
         # Search icon (using Unicode symbol for now)
         search_icon = QLabel("🔍")
-        search_icon.setStyleSheet(f"""
-            QLabel {{
-                color: {TEXT_SECONDARY};
-                font-size: {FONT_SIZE_LARGE};
-                padding: 0px 8px 0px 0px;
-            }}
-        """)
+        search_icon.setStyleSheet(_SEARCH_ICON_QSS)
         container_layout.addWidget(search_icon)
         
         # Search field
@@ -246,21 +620,7 @@ class SpotlightStyleSearchBar(QWidget):
         self.search_box.setMinimumHeight(60)
         
         # Modern search field styling
-        self.search_box.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: transparent;
-                color: {TEXT_COLOR};
-                border: none;
-                font-family: {FONT_FAMILY};
-                font-size: {FONT_SIZE_LARGE};
-                font-weight: 400;
-                padding: 4px;
-            }}
-            QLineEdit::placeholder {{
-                color: {TEXT_SECONDARY};
-                font-style: italic;
-            }}
-        """)
+        self.search_box.setStyleSheet(_SEARCH_BOX_QSS)
         
         # Add to container layout
         container_layout.addWidget(self.search_box)
@@ -288,7 +648,87 @@ class SpotlightStyleSearchBar(QWidget):
         self.search_box.setFocus()
         self.search_box.selectAll()
 
-class SpotlightResultsList(QListWidget):
+class ResultsModel(QAbstractListModel):
+    """
+    List model for search results
+    
+    The rows are stored as parallel lists per field instead of one item object
+    per row. Only RESULT_PAGE_SIZE rows are exposed at first, the view fetches
+    more while scrolling down.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.texts = []
+        self.tooltips = []
+        self.full_paths = []
+        self.font = QFont()
+        self.font.setFamily(FONT_FAMILY)
+        self._loaded = 0
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+    
+    def data(self, index, role=Qt.DisplayRole):
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self.texts[row]
+        if role == Qt.ToolTipRole:
+            return self.tooltips[row]
+        if role == Qt.UserRole:
+            return self.full_paths[row]
+        if role == Qt.FontRole:
+            return self.font
+        return None
+    
+    def set_rows(self, rows):
+        """
+        Replaces the results
+        
+        Args:
+            rows: Formatted (text, tooltip, full_path) rows
+        """
+        self.beginResetModel()
+        self.texts = [row[0] for row in rows]
+        self.tooltips = [row[1] for row in rows]
+        self.full_paths = [row[2] for row in rows]
+        self._loaded = min(len(rows), RESULT_PAGE_SIZE)
+        self.endResetModel()
+    
+    def clear(self):
+        """Removes all results"""
+        self.set_rows([])
+    
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self._loaded < len(self.texts)
+    
+    def fetchMore(self, parent):
+        if parent.isValid():
+            return
+        count = min(len(self.texts) - self._loaded, RESULT_PAGE_SIZE)
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+class ResultsDelegate(QStyledItemDelegate):
+    """
+    Item delegate that reads the paint data straight from the ResultsModel lists
+    
+    The default initStyleOption queries the model once per role, which means
+    several Python data() calls per painted row.
+    """
+    
+    def initStyleOption(self, option, index):
+        model = index.model()
+        option.index = index
+        option.font = model.font
+        option.fontMetrics = QFontMetrics(model.font)
+        # Qt only breaks display text at line separators, like QStyledItemDelegate.displayText
+        option.text = model.texts[index.row()].replace('\n', '\u2028')
+        option.features |= QStyleOptionViewItem.HasDisplay
+        option.displayAlignment = Qt.AlignLeft | Qt.AlignVCenter
+
+class SpotlightResultsList(QListView):
     """List of search results in Spotlight style"""
     
     item_selected = pyqtSignal(str)
@@ -296,97 +736,72 @@ class SpotlightResultsList(QListWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        self.results_model = ResultsModel(self)
+        self.setModel(self.results_model)
+        self.setItemDelegate(ResultsDelegate(self))
+        
         # Styling
         self.setFrameShape(QFrame.NoFrame)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        # All rows share the same layout, so Qt can skip measuring each item
+        self.setUniformItemSizes(True)
         
         # Container for the results list
         self.setObjectName("resultsList")
         
         # MODERN UI UPGRADE - Enhanced styling
-        self.setStyleSheet(f"""
-            #resultsList {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {BACKGROUND_SECONDARY}, stop:1 {BACKGROUND_COLOR});
-                color: {TEXT_COLOR};
-                border: none;
-                border-radius: {BORDER_RADIUS_LARGE}px;
-                padding: {SPACING_MEDIUM}px;
-                font-family: {FONT_FAMILY};
-                selection-background-color: transparent;
-            }}
-            QListWidget::item {{
-                border-radius: {BORDER_RADIUS}px;
-                padding: {SPACING_MEDIUM}px {SPACING_LARGE}px;
-                margin-bottom: 6px;
-                min-height: 50px;
-                border-left: 3px solid transparent;
-                font-size: {FONT_SIZE_MEDIUM};
-                background: transparent;
-            }}
-            QListWidget::item:selected {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {ACCENT_COLOR}, stop:1 {ACCENT_HOVER});
-                color: white;
-                border-left: 3px solid white;
-                font-weight: 500;
-            }}
-            QListWidget::item:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {BACKGROUND_SECONDARY}, stop:1 rgba(45, 45, 45, 0.8));
-                border-left: 3px solid {ACCENT_COLOR};
-            }}
-            QListWidget::item:selected:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {ACCENT_HOVER}, stop:1 {ACCENT_COLOR});
-            }}
-            QScrollBar:vertical {{
-                border: none;
-                background: {BACKGROUND_COLOR};
-                width: 10px;
-                margin: {SPACING_MEDIUM}px 3px {SPACING_MEDIUM}px 3px;
-                border-radius: 5px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {BORDER_COLOR}, stop:1 {BORDER_LIGHT});
-                min-height: 30px;
-                border-radius: 5px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {ACCENT_COLOR}, stop:1 {ACCENT_HOVER});
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                border: none;
-                background: none;
-                height: 0px;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background: none;
-            }}
-        """)
+        self.setStyleSheet(_RESULTS_LIST_QSS)
         
         # Signals
-        self.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.doubleClicked.connect(self.on_item_double_clicked)
+    
+    def set_rows(self, rows):
+        """Shows formatted (text, tooltip, full_path) rows"""
+        self.results_model.set_rows(rows)
+    
+    def clear(self):
+        """Removes all results"""
+        self.results_model.clear()
         
-    def on_item_double_clicked(self, item):
-        data = item.data(Qt.UserRole)
+    def on_item_double_clicked(self, index):
+        data = index.data(Qt.UserRole)
         if data:
             self.item_selected.emit(data)
 
 class SpotlightWindow(QDialog):
     """Main window in Spotlight style"""
     
-    def __init__(self, indexer, search_engine):
+    def __init__(self, indexer, search_engine, main_window=None):
         super().__init__(None, Qt.FramelessWindowHint)
         
         self.indexer = indexer
         self.search_engine = search_engine
-        
-        # Search thread
-        self.search_thread = None
+        # MainWindow that owns the settings dialog
+        self._main_window = main_window
+        
+        # All formatted rows of the displayed search
+        self._full_results = []
+        
+        # Formatted rows of recent queries (LRU order)
+        self._result_cache = collections.OrderedDict()
+        # Last complete plain search as (query, results, rows), refined locally while typing on
+        self._refine_base = None
+        
+        # Persistent search worker thread, requests are identified by a token
+        self._search_token = 0
+        self._search_query = None
+        self._search_started = 0.0
+        # Duration of the last search, used to adapt the debounce delay
+        self._last_search_ms = 0.0
+        self._worker_thread = QThread(self)
+        self._worker = SearchWorker(self.search_engine)
+        self._worker.moveToThread(self._worker_thread)
+        self._worker.results_ready.connect(self.on_results_ready)
+        self._worker.error_occurred.connect(self.show_error)
+        self._worker_thread.finished.connect(self._worker.deleteLater)
+        self._worker_thread.start()
+        QApplication.instance().aboutToQuit.connect(self.stop_worker_thread)
         
         # Timer for delayed search
         self.search_timer = QTimer(self)
@@ -414,19 +829,11 @@ class SpotlightWindow(QDialog):
         self.content_widget.setObjectName("contentWidget")
         
         # MODERN UI UPGRADE - Glassmorphism effect
-        self.content_widget.setStyleSheet(f"""
-            #contentWidget {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {GLASS_BACKGROUND}, stop:1 {BACKGROUND_COLOR});
-                border-radius: {BORDER_RADIUS_LARGE * 2}px;
-                border: 2px solid {BORDER_COLOR};
-                backdrop-filter: blur(20px);
-            }}
-        """)
+        self.content_widget.setStyleSheet(_CONTENT_WIDGET_QSS)
         
         # Layout for the entire window (transparent background)
         main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(20, 20, 20, 20)  # Space for shadow
+        main_layout.setContentsMargins(SHADOW_MARGIN, SHADOW_MARGIN, SHADOW_MARGIN, SHADOW_MARGIN)  # Space for shadow
         main_layout.addWidget(self.content_widget)
         
         # Layout for the content
@@ -434,13 +841,6 @@ class SpotlightWindow(QDialog):
         content_layout.setContentsMargins(20, 20, 20, 20)
         content_layout.setSpacing(10)
         
-        # Shadow effect for the content
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(30)
-        shadow.setColor(QColor(0, 0, 0, 150))
-        shadow.setOffset(0, 5)
-        self.content_widget.setGraphicsEffect(shadow)
-        
         # Search bar
         self.search_bar = SpotlightStyleSearchBar()
         self.search_bar.search_triggered.connect(self.on_search_triggered)
@@ -461,11 +861,27 @@ class SpotlightWindow(QDialog):
         self.fade_animation.setStartValue(0.0)
         self.fade_animation.setEndValue(1.0)
         self.fade_animation.setEasingCurve(QEasingCurve.OutCubic)
+        
+        # Resolve the stylesheets of all child widgets and render the shadow now,
+        # so the first show from the hotkey does not pay for it
+        self.ensurePolished()
+        _shadow_pixmap()
+    
+    def paintEvent(self, event):
+        """Paints the pre-rendered shadow into the transparent window margin"""
+        pixmap = _shadow_pixmap()
+        border = SHADOW_MARGIN + BORDER_RADIUS_LARGE * 2
+        margins = QMargins(border, border, border, border)
+        painter = QPainter(self)
+        qDrawBorderPixmap(painter, self.rect().translated(0, SHADOW_OFFSET), margins, pixmap)
+        painter.end()
     
     def showEvent(self, event):
         """Override show event to add animation"""
         super().showEvent(event)
         if hasattr(self, 'fade_animation'):
+            # Restart from the beginning instead of overlapping a running fade
+            self.fade_animation.stop()
             self.fade_animation.start()
     
     def keyPressEvent(self, event):
@@ -492,40 +908,79 @@ class SpotlightWindow(QDialog):
         if self.search_timer.isActive():
             self.search_timer.stop()
         
+        query = text.strip()
+        # Same query as the shown results (e.g. pasted again), nothing to do
+        if query and query == getattr(self, 'last_query', None):
+            return
         # Only search if text is not empty
-        if text.strip():
-            self.search_timer.start(300)
+        if query:
+            if query.startswith(('=', '@')):
+                # Calculations and commands take microseconds, handle them right away in the UI thread
+                self.stop_current_search()
+                self.last_query = query
+                self.display_results(self._handle_command(query))
+                return
+            # Longer queries have smaller result sets, so wait less for them,
+            # but never less than a good part of what the last search took
+            delay = 120 if len(query) >= 4 else 260
+            delay = max(delay, min(400, int(self._last_search_ms * 0.6)))
+            self.search_timer.start(delay)
         else:
             # Clear results immediately for empty search
             self.results_list.clear()
             self.stop_current_search()
+            self.last_query = None
+        
+    def _handle_command(self, query):
+        """
+        Builds the results of a "=" calculation or "@" command query
         
+        Args:
+            query: Query starting with "=" or "@"
+            
+        Returns:
+            Result list for the query
+        """
+        if query.startswith('='):
+            return self.calculate(query)
+        # Show settings
+        return [{"filename": "Open Settings", "path": "BetterFinder", 
+                 "size": 0, "last_modified": datetime.now(), "full_path": "settings",
+                 "type": "command"}]
+    
+    def calculate(self, query):
+        """
+        Evaluates a "=" calculation query
+        
+        Args:
+            query: Query starting with "="
+            
+        Returns:
+            Result list with the calculation, empty if the expression is invalid
+        """
+        expression = query[1:].strip()
+        try:
+            # str() is inside the try: ints beyond the interpreter's digit limit raise ValueError
+            result = str(_calc(expression))
+        except (ValueError, SyntaxError, TypeError, ArithmeticError, RecursionError, MemoryError):
+            return []
+        return [{"filename": f"{expression} = {result}", "path": "Calculation", 
+                 "size": 0, "last_modified": datetime.now(), "full_path": result,
+                 "type": "calculation"}]
+    
     def stop_current_search(self):
-        """Stops the current search thread if it exists - IMPROVED"""
-        if self.search_thread and self.search_thread.isRunning():
-            try:
-                # Signal the thread to stop
-                if hasattr(self.search_thread, 'stop'):
-                    self.search_thread.stop()
-                
-                # Disconnect all signals to prevent race conditions
-                self.search_thread.results_ready.disconnect()
-                self.search_thread.error_occurred.disconnect()
-                
-                # Try graceful termination first
-                self.search_thread.quit()
-                if not self.search_thread.wait(1000):  # Wait max 1 second
-                    # Force termination if needed
-                    self.search_thread.terminate()
-                    self.search_thread.wait(500)
-                    
-            except Exception as e:
-                print(f"Error stopping search thread: {e}")
-            finally:
-                self.search_thread = None
+        """Cancels the current search by invalidating its token"""
+        self._search_token += 1
+        self._worker.current_token = self._search_token
+    
+    def stop_worker_thread(self):
+        """Stops the search worker thread when the application quits"""
+        self.stop_current_search()
+        self._worker_thread.quit()
+        self._worker_thread.wait()
     
     def perform_search(self):
-        """Performs the actual search - IMPROVED THREAD SAFETY"""
+        """Performs the actual search in the worker thread"""
         query = self.search_bar.get_text().strip()
         
         # Check if search text is empty
@@ -539,125 +994,149 @@ class SpotlightWindow(QDialog):
         
         self.last_query = query
         
-        # Stop current thread safely
+        # Outdate any running search
         self.stop_current_search()
         
-        # Small delay to ensure thread cleanup
-        QTimer.singleShot(50, lambda: self._start_search_thread(query))
+        # Reuse the results of a recent identical query
+        rows = self._result_cache.get(query)
+        if rows is not None:
+            self._result_cache.move_to_end(query)
+            self._render_rows(rows)
+            return
+        
+        # Narrow down the previous results if the query only got longer
+        if self._incremental_filter(query):
+            return
+        
+        # Queue the new search in the worker thread
+        self._search_query = query
+        self._search_started = time.perf_counter()
+        QMetaObject.invokeMethod(
+            self._worker, "do_search", Qt.QueuedConnection,
+            Q_ARG(str, query), Q_ARG(int, self._search_token)
+        )
+        
+        logger.debug("Started search for: '%s'", query)
     
-    def _start_search_thread(self, query):
-        """Helper method to start search thread"""
-        try:
-            # Double-check that no thread is running
-            if self.search_thread and self.search_thread.isRunning():
-                print("Warning: Previous search thread still running")
-                return
-            
-            # Create and start new search thread
-            self.search_thread = SearchThread(self.search_engine, query, None)
-            self.search_thread.results_ready.connect(self.display_results)
-            self.search_thread.error_occurred.connect(self.show_error)
-            self.search_thread.start()
-            
-            print(f"Started search for: '{query}'")
+    def on_results_ready(self, results, token):
+        """Shows the results of the worker unless a newer search was started"""
+        if token != self._search_token:
+            return
+        self._last_search_ms = (time.perf_counter() - self._search_started) * 1000
+        self.display_results(results, self._search_query)
+        
+        # A complete result set of a plain query can be refined without the database
+        if (_is_plain_query(self._search_query) and len(results) < SEARCH_RESULT_LIMIT
+                and not self._index_changing()):
+            self._refine_base = (self._search_query, results, self._full_results)
+    
+    def _incremental_filter(self, query: str) -> bool:
+        """
+        Filters the last plain search results for a query that extends it
+        
+        Args:
+            query: The new search query
             
-        except Exception as e:
-            print(f"Error starting search thread: {e}")
-            self.show_error(f"Search error: {str(e)}")
+        Returns:
+            True if the results were shown without a new search
+        """
+        if self._refine_base is None or not _is_plain_query(query) or self._index_changing():
+            return False
+        base_query, base_results, base_rows = self._refine_base
+        if not query.startswith(base_query):
+            return False
+        
+        # Fold case like SQLite's LIKE, so the refined results match a fresh query
+        needle = query.translate(_ASCII_LOWER)
+        results = []
+        rows = []
+        for result, row in zip(base_results, base_rows):
+            if needle in result['filename'].translate(_ASCII_LOWER):
+                results.append(result)
+                rows.append(row)
+        
+        self._refine_base = (query, results, rows)
+        self._cache_rows(query, rows)
+        self._render_rows(rows)
+        return True
     
-    def display_results(self, results):
-        """Shows the search results - MODERN UI UPGRADE"""
-        self.results_list.clear()
+    def display_results(self, results, query: Optional[str] = None):
+        """
+        Shows the search results - MODERN UI UPGRADE
         
+        Args:
+            results: Search results
+            query: Query the results belong to, used to cache the formatted rows
+        """
+        rows = self._format_results(results)
+        if query is not None:
+            self._cache_rows(query, rows)
+        self._render_rows(rows)
+    
+    def _index_changing(self) -> bool:
+        """Returns True while the indexer is still writing files to the database"""
+        index_thread = getattr(self.indexer, 'index_thread', None)
+        return index_thread is not None and index_thread.is_alive()
+    
+    def _cache_rows(self, query: str, rows):
+        """Stores the formatted rows of a query in the LRU cache"""
+        # Results found while indexing are incomplete and must not be reused
+        if not rows or self._index_changing():
+            return
+        self._result_cache[query] = rows
+        self._result_cache.move_to_end(query)
+        if len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+    
+    def _format_results(self, results):
+        """Formats search results as (text, tooltip, full_path) rows"""
+        rows = []
+        append = rows.append
+        get_file_icon = self.get_file_icon
         for result in results:
-            item = QListWidgetItem()
-            
             # Enhanced item text and icon based on type
-            if 'type' in result and result['type'] == 'calculation':
+            result_type = result.get('type')
+            if result_type == 'calculation':
                 # Math calculation with modern formatting
-                item.setText(f"🧮  {result['filename']}")
-                item.setToolTip("Mathematical calculation")
-            elif 'type' in result and result['type'] == 'command':
+                display_text = f"🧮  {result['filename']}"
+                tooltip = "Mathematical calculation"
+            elif result_type == 'command':
                 # Command with settings icon
-                item.setText(f"⚙️  {result['filename']}")
-                item.setToolTip("BetterFinder command")
+                display_text = f"⚙️  {result['filename']}"
+                tooltip = "BetterFinder command"
             else:
                 # Enhanced file display with better formatting
                 filename = result['filename']
                 path = result['path']
                 
-                # File type icons based on extension
-                file_icon = self.get_file_icon(filename)
-                
                 # Format: Icon + Filename + Path (secondary color)
-                display_text = f"{file_icon}  {filename}"
+                display_text = f"{get_file_icon(filename)}  {filename}"
                 if path and path != filename:
-                    # Truncate long paths for better readability
-                    if len(path) > 50:
-                        path = "..." + path[-47:]
-                    display_text += f"\n    📁 {path}"
+                    display_text += _path_line(path)
                 
-                item.setText(display_text)
-                item.setToolTip(result.get('full_path', ''))
-            
-            # Data for double click storage
-            item.setData(Qt.UserRole, result['full_path'])
+                tooltip = result.get('full_path', '')
             
-            # Enhanced styling for individual items
-            font = item.font()
-            font.setFamily(FONT_FAMILY)
-            item.setFont(font)
-            
-            self.results_list.addItem(item)
+            append((display_text, tooltip, result['full_path']))
+        return rows
+    
+    def _render_rows(self, rows):
+        """Shows formatted rows in the results list"""
+        self._full_results = rows
+        self.results_list.set_rows(rows)
+    
+    def clear_result_cache(self):
+        """Drops cached results, e.g. after the index changed"""
+        self._result_cache.clear()
+        self._refine_base = None
     
     def get_file_icon(self, filename):
         """Returns appropriate emoji icon based on file extension"""
         if not filename:
             return "📄"
-            
-        ext = filename.lower().split('.')[-1] if '.' in filename else ''
-        
-        # Icon mapping for common file types
-        icon_map = {
-            # Documents
-            'pdf': '📕', 'doc': '📘', 'docx': '📘', 'txt': '📄', 'rtf': '📄',
-            'odt': '📄', 'pages': '📄',
-            
-            # Spreadsheets
-            'xls': '📊', 'xlsx': '📊', 'csv': '📊', 'ods': '📊', 'numbers': '📊',
-            
-            # Presentations
-            'ppt': '📽️', 'pptx': '📽️', 'odp': '📽️', 'key': '📽️',
-            
-            # Images
-            'jpg': '🖼️', 'jpeg': '🖼️', 'png': '🖼️', 'gif': '🖼️', 'bmp': '🖼️',
-            'svg': '🖼️', 'ico': '🖼️', 'tiff': '🖼️', 'webp': '🖼️',
-            
-            # Videos
-            'mp4': '🎬', 'avi': '🎬', 'mkv': '🎬', 'mov': '🎬', 'wmv': '🎬',
-            'flv': '🎬', 'webm': '🎬', 'm4v': '🎬',
-            
-            # Audio
-            'mp3': '🎵', 'wav': '🎵', 'flac': '🎵', 'aac': '🎵', 'ogg': '🎵',
-            'wma': '🎵', 'm4a': '🎵',
-            
-            # Archives
-            'zip': '📦', 'rar': '📦', '7z': '📦', 'tar': '📦', 'gz': '📦',
-            'bz2': '📦', 'xz': '📦',
-            
-            # Code files
-            'py': '🐍', 'js': '📜', 'html': '🌐', 'css': '🎨', 'cpp': '⚙️',
-            'c': '⚙️', 'java': '☕', 'php': '🐘', 'rb': '💎', 'go': '🐹',
-            'rs': '🦀', 'swift': '🦉', 'kt': '🎯', 'ts': '📜',
-            
-            # Executables
-            'exe': '⚡', 'msi': '⚡', 'app': '⚡', 'deb': '⚡', 'rpm': '⚡',
-            
-            # Folders (special case)
-            'folder': '📁'
-        }
         
-        return icon_map.get(ext, '📄')
+        dot = filename.rfind('.')
+        ext = filename[dot + 1:].lower() if dot >= 0 else ''
+        return _ICON_MAP.get(ext, '📄')
     
     def on_item_selected(self, path):
         """Handles selection of a result"""
@@ -665,23 +1144,13 @@ class SpotlightWindow(QDialog):
             # Open settings - FIX: Import and use proper settings dialog
             self.hide()
             try:
-                from app.gui.settings_dialog import SettingsDialog
-                # Get parent window (MainWindow) from the spotlight window
-                parent_window = None
-                for widget in QApplication.topLevelWidgets():
-                    if isinstance(widget, MainWindow):
-                        parent_window = widget
-                        break
-                
-                if parent_window:
-                    dialog = SettingsDialog(parent_window)
-                    dialog.exec_()
+                if self._main_window:
+                    self._main_window.show_settings()
                 else:
-                    print("Warning: Could not find main window for settings dialog")
+                    logger.warning("Could not find main window for settings dialog")
             except Exception as e:
-                print(f"Error opening settings: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.warning("Error opening settings: %s", e)
+                logger.debug("Settings error details", exc_info=True)
             return
             
         try:
@@ -693,14 +1162,82 @@ class SpotlightWindow(QDialog):
     
     def show_error(self, error_message):
         """Shows an error message"""
-        print(f"Error: {error_message}")
+        logger.warning("Error: %s", error_message)
         # Here a error icon could be displayed in the results list
 
 # SettingsDialog class removed - using separate settings_dialog.py file instead
 
+class AutostartSignals(QObject):
+    """Signals of the AutostartWorker"""
+    
+    # Signal with success flag and error message
+    finished = pyqtSignal(bool, str)
+
+class AutostartWorker(QRunnable):
+    """Configures autostart in the thread pool, registry and file access may be slow (e.g. virus scans)"""
+    
+    def __init__(self, enable: bool):
+        """
+        Initializes the autostart worker
+        
+        Args:
+            enable: True to create the autostart entry, False to remove it
+        """
+        super().__init__()
+        self.enable = enable
+        self.signals = AutostartSignals()
+    
+    def run(self):
+        """Configures autostart and reports the result"""
+        try:
+            self._configure()
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+        else:
+            self.signals.finished.emit(True, "")
+    
+    def _configure(self):
+        """Creates or removes the autostart entry in the HKCU Run key"""
+        try:
+            # Path to the executable
+            if getattr(sys, 'frozen', False):
+                # If the application was created with PyInstaller
+                app_path = sys.executable
+            else:
+                # If the application is run with Python
+                app_path = os.path.abspath(sys.argv[0])
+            
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, AUTOSTART_RUN_KEY, 0, winreg.KEY_SET_VALUE) as key:
+                if self.enable:
+                    winreg.SetValueEx(key, "BetterFinder", 0, winreg.REG_SZ, f'"{app_path}"')
+                    logger.debug("Autostart entry created successfully")
+                else:
+                    try:
+                        winreg.DeleteValue(key, "BetterFinder")
+                        logger.debug("Autostart entry removed successfully")
+                    except FileNotFoundError:
+                        pass
+            
+            self._remove_legacy_startup_files()
+        except OSError as e:
+            # Pass all errors to a higher level
+            print(f"Autostart configuration failed: {e}")
+            raise Exception(f"Could not update the autostart registry entry: {e}")
+    
+    def _remove_legacy_startup_files(self):
+        """Removes the Startup folder files written by older versions"""
+        for path in _LEGACY_STARTUP_FILES:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
 class MainWindow(QMainWindow):
     """Main window of the application"""
     
+    # Fallback shortcut when the global hotkey is unavailable, built from the key code
+    _SPOTLIGHT_SEQ = QKeySequence(Qt.ControlModifier | Qt.Key_Space)
+    
     def __init__(self):
         """Initializes the main window"""
         super().__init__()
@@ -711,26 +1248,52 @@ class MainWindow(QMainWindow):
         
         # Load settings
         self.settings = QSettings("BetterFinder", "BetterFinder")
-        self.restore_settings()
         
         # Initialize components
         self.init_core_components()
         
-        # Central widget with info text
-        central_widget = QWidget()
-        layout = QVBoxLayout(central_widget)
-        
-        info_label = QLabel("BetterFinder running in the background.\nPress Ctrl+Space to open the search.")
-        info_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(info_label)
-        
-        self.setCentralWidget(central_widget)
+        # Tray notifications are debounced so bursts only show the latest one
+        self._pending_notification = None
+        self._last_notification = None
+        self._last_notification_time = 0.0
+        self._notification_timer = QTimer(self)
+        self._notification_timer.setSingleShot(True)
+        self._notification_timer.timeout.connect(self._flush_notification)
+        # Set by setup_tray_icon, notifications are skipped if the tray cannot show them
+        self._tray_can_message = False
+        # Tray icon visibility, checked once after the icon was shown
+        self._tray_visible = False
+        
+        # Settings dialog, created on first use and reused afterwards
+        self._settings_dialog = None
+        
+        # Coalesce status updates: only the latest message is flushed every 100 ms.
+        # The timer only runs while indexing, the only source of status updates.
+        self._pending_status: Optional[str] = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setInterval(100)
+        self._status_timer.timeout.connect(self._flush_status)
+        
+        # With a system tray the main window is never shown, so skip the info text
+        tray_available = QSystemTrayIcon.isSystemTrayAvailable()
+        if tray_available:
+            self.setCentralWidget(QWidget())
+        else:
+            # Central widget with info text
+            central_widget = QWidget()
+            layout = QVBoxLayout(central_widget)
+            
+            info_label = QLabel("BetterFinder running in the background.\nPress Ctrl+Space to open the search.")
+            info_label.setAlignment(Qt.AlignCenter)
+            layout.addWidget(info_label)
+            
+            self.setCentralWidget(central_widget)
         
         # System tray icon
         self.setup_tray_icon()
         
         # Spotlight window
-        self.spotlight = SpotlightWindow(self.indexer, self.search_engine)
+        self.spotlight = SpotlightWindow(self.indexer, self.search_engine, main_window=self)
         
         # Hotkey to open (Ctrl+Space)
         self.setup_global_hotkey()
@@ -738,25 +1301,59 @@ class MainWindow(QMainWindow):
         # Start indexing
         self.start_indexing()
         
-        # Show spotlight window immediately
-        QTimer.singleShot(500, self.show_spotlight)
+        if tray_available:
+            # Stay in the tray without showing (and repainting) the main window
+            self.hide_to_tray()
+        else:
+            # No tray, so the main window is the only visible sign of the app
+            self.show()
         
-        # Show the window first so the tray icon registers correctly
-        self.show()
-        # Wait briefly and minimize then
-        QTimer.singleShot(2000, self.hide_to_tray)
+        # Show spotlight window immediately
+        self.show_spotlight()
     
     def hide_to_tray(self):
         """Hides the window in the tray"""
         self.hide()
-        if self.tray_icon.isVisible():
-            self.tray_icon.showMessage("BetterFinder", "BetterFinder running in the background.\nPress Ctrl+Space to search", QSystemTrayIcon.Information, 5000)
+        if self._tray_visible:
+            self._notify("BetterFinder", "BetterFinder running in the background.\nPress Ctrl+Space to search", QSystemTrayIcon.Information, 5000)
+    
+    def _notify(self, title: str, message: str, icon=QSystemTrayIcon.Information, msecs: int = 3000):
+        """
+        Shows a tray notification after a short delay
+        
+        Only the most recent notification of a burst is shown, and a notification
+        identical to the one shown less than a second ago is dropped.
+        
+        Args:
+            title: Notification title
+            message: Notification text
+            icon: Notification icon
+            msecs: Display duration in milliseconds
+        """
+        if not self._tray_can_message:
+            return
+        if ((title, message) == self._last_notification
+                and time.monotonic() - self._last_notification_time < 1.0):
+            return
+        self._pending_notification = (title, message, icon, msecs)
+        self._notification_timer.start(300)
+    
+    def _flush_notification(self):
+        """Shows the pending tray notification"""
+        if self._pending_notification is None:
+            return
+        title, message, icon, msecs = self._pending_notification
+        self._pending_notification = None
+        self._last_notification = (title, message)
+        self._last_notification_time = time.monotonic()
+        self.tray_icon.showMessage(title, message, icon, msecs)
     
     def init_core_components(self):
         """Initializes the core components (indexer, search engine)"""
         try:
-            # Path to index database
-            db_path = os.path.join(os.path.expanduser("~"), "BetterFinder", "index.db")
+            # Path to index database (AppData\Roaming\BetterFinder\BetterFinder on Windows)
+            data_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+            db_path = os.path.join(data_dir, "index.db")
             
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(db_path), exist_ok=True)
@@ -767,10 +1364,11 @@ class MainWindow(QMainWindow):
             
             # Thread variables
             self.indexing_thread = None
+            self._indexing_active = False
         except Exception as e:
             # Error handling if components cannot be initialized
             print(f"Error initializing components: {e}")
-            traceback.print_exc()
+            logger.debug("Initialization error details", exc_info=True)
             QMessageBox.critical(self, "Critical error", 
                                 f"BetterFinder could not be initialized: {str(e)}")
             sys.exit(1)
@@ -780,30 +1378,7 @@ class MainWindow(QMainWindow):
         try:
             self.tray_icon = QSystemTrayIcon(self)
             
-            # Try to load the BetterFinder icon
-            icon_paths = [
-                "BetterFinder-Icon.png",                               # In main directory
-                os.path.join(os.getcwd(), "BetterFinder-Icon.png"),    # Absolute path
-                os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "BetterFinder-Icon.png") # Relative path from class
-            ]
-            
-            icon_set = False
-            for path in icon_paths:
-                if os.path.exists(path):
-                    try:
-                        print(f"Trying to load icon: {path}")
-                        self.tray_icon.setIcon(QIcon(path))
-                        icon_set = True
-                        print(f"BetterFinder icon loaded successfully from: {path}")
-                        break
-                    except Exception as e:
-                        print(f"Error loading icon from {path}: {e}")
-            
-            if not icon_set:
-                # Fallback: Use system icon
-                print("Could not load BetterFinder icon, use system icon as fallback")
-                system_icon = QApplication.style().standardIcon(QApplication.style().SP_DialogHelpButton)
-                self.tray_icon.setIcon(system_icon)
+            self.tray_icon.setIcon(_app_icon())
             
             # Tray menu
             tray_menu = QMenu()
@@ -832,24 +1407,48 @@ class MainWindow(QMainWindow):
             # Set menu and show icon
             self.tray_icon.setContextMenu(tray_menu)
             self.tray_icon.show()
+            # Let the tray icon register before the window is hidden
+            QApplication.processEvents()
             
             # Icon click connection
             self.tray_icon.activated.connect(self.on_tray_icon_activated)
             
-            print(f"Tray icon visible: {self.tray_icon.isVisible()}")
-            if not self.tray_icon.isVisible():
-                print("WARNING: Tray icon is not visible!")
+            self._tray_can_message = self.tray_icon.supportsMessages()
+            
+            self._tray_visible = self.tray_icon.isVisible()
+            if not self._tray_visible:
+                logger.warning("Tray icon is not visible!")
             
         except Exception as e:
             # If system tray is not supported
             print(f"System tray is not supported: {e}")
-            traceback.print_exc()
+            logger.debug("Tray icon error details", exc_info=True)
     
     def setup_global_hotkey(self):
         """Sets up the global hotkey"""
-        self.shortcut = QShortcut(QKeySequence("Ctrl+Space"), self)
+        self._hotkey_filter = None
+        if sys.platform == "win32":
+            # Register Ctrl+Space system-wide, WM_HOTKEY arrives via the native event filter
+            self._hotkey_filter = GlobalHotkeyFilter(self, "show_spotlight")
+            QApplication.instance().installNativeEventFilter(self._hotkey_filter)
+            if ctypes.windll.user32.RegisterHotKey(int(self.winId()), HOTKEY_ID, MOD_CONTROL, VK_SPACE):
+                return
+            
+            print("Could not register global hotkey, falling back to window shortcut")
+            QApplication.instance().removeNativeEventFilter(self._hotkey_filter)
+            self._hotkey_filter = None
+        
+        # Fallback: only works while BetterFinder has focus
+        self.shortcut = QShortcut(self._SPOTLIGHT_SEQ, self)
         self.shortcut.activated.connect(self.show_spotlight)
     
+    def unregister_global_hotkey(self):
+        """Releases the global hotkey"""
+        if self._hotkey_filter is not None:
+            ctypes.windll.user32.UnregisterHotKey(int(self.winId()), HOTKEY_ID)
+            QApplication.instance().removeNativeEventFilter(self._hotkey_filter)
+            self._hotkey_filter = None
+    
     def on_tray_icon_activated(self, reason):
         """
         Handles clicks on the tray icon
@@ -860,6 +1459,7 @@ class MainWindow(QMainWindow):
         if reason == QSystemTrayIcon.DoubleClick or reason == QSystemTrayIcon.Trigger:
             self.show_spotlight()
     
+    @pyqtSlot()
     def show_spotlight(self):
         """Shows the spotlight window"""
         if not self.spotlight.isVisible():
@@ -868,22 +1468,37 @@ class MainWindow(QMainWindow):
     
     def start_indexing(self):
         """Starts indexing the file system"""
-        if self.indexing_thread and self.indexing_thread.isRunning():
-            self.tray_icon.showMessage("BetterFinder", "Indexing already running...", QSystemTrayIcon.Information, 3000)
+        if self._indexing_active:
+            self._notify("BetterFinder", "Indexing already running...", QSystemTrayIcon.Information, 3000)
             return
         
-        self.tray_icon.showMessage("BetterFinder", "Indexing started...", QSystemTrayIcon.Information, 3000)
+        self._notify("BetterFinder", "Indexing started...", QSystemTrayIcon.Information, 3000)
         
         self.indexing_thread = IndexingThread(self.indexer)
-        self.indexing_thread.progress.connect(self.update_status)
-        self.indexing_thread.finished_indexing.connect(self.on_indexing_finished)
-        self.indexing_thread.error_occurred.connect(self.show_error)
-        self.indexing_thread.start()
+        # update_status only stores the message, so it can run directly in the indexing thread
+        self.indexing_thread.progress.connect(self.update_status, Qt.DirectConnection)
+        # These touch the tray icon and must run in the GUI thread
+        self.indexing_thread.finished_indexing.connect(self.on_indexing_finished, Qt.QueuedConnection)
+        self.indexing_thread.error_occurred.connect(self.show_error, Qt.QueuedConnection)
+        # Cleared when the thread ends, whether indexing succeeded or failed
+        self.indexing_thread.finished.connect(self._on_indexing_thread_finished)
+        # Keep the search worker responsive while the index is built
+        self._indexing_active = True
+        self._status_timer.start()
+        self.indexing_thread.start(QThread.LowPriority)
+    
+    def _on_indexing_thread_finished(self):
+        """Allows a new indexing run once the indexing thread has ended"""
+        self._indexing_active = False
+        self._status_timer.stop()
+        self._flush_status()
     
     def on_indexing_finished(self):
         """Called when indexing is completed"""
         self.update_status("Indexing completed.")
-        self.tray_icon.showMessage("BetterFinder", "Indexing completed", QSystemTrayIcon.Information, 3000)
+        # Cached search results may be outdated now
+        self.spotlight.clear_result_cache()
+        self._notify("BetterFinder", "Indexing completed", QSystemTrayIcon.Information, 3000)
     
     def update_status(self, message: str):
         """
@@ -892,8 +1507,17 @@ class MainWindow(QMainWindow):
         Args:
             message: Message to display
         """
-        print(f"Status: {message}")
+        # Only remember the latest message, the status timer flushes it.
+        # Must stay a plain assignment: it is called directly from the indexing thread.
+        self._pending_status = message
+    
+    def _flush_status(self):
+        """Outputs the pending status message, if any"""
+        if self._pending_status is None:
+            return
+        logger.info("Status: %s", self._pending_status)
         # Could also be displayed in a label in the spotlight window
+        self._pending_status = None
     
     def show_error(self, error_message: str):
         """
@@ -902,26 +1526,27 @@ class MainWindow(QMainWindow):
         Args:
             error_message: Message to display
         """
-        self.tray_icon.showMessage("BetterFinder Error", error_message, QSystemTrayIcon.Critical, 5000)
+        self._notify("BetterFinder Error", error_message, QSystemTrayIcon.Critical, 5000)
     
     def show_settings(self):
         """Shows the settings - FIXED"""
         try:
-            from app.gui.settings_dialog import SettingsDialog
-            dialog = SettingsDialog(self)
-            if dialog.exec_() == QDialog.Accepted:
+            if self._settings_dialog is None:
+                self._settings_dialog = SettingsDialog(self)
+            else:
+                self._settings_dialog.reload_current_settings()
+            if self._settings_dialog.exec_() == QDialog.Accepted:
                 # Settings were saved
                 # Update application with new settings
                 self.apply_settings()
         except Exception as e:
             print(f"Error opening settings: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.debug("Settings error details", exc_info=True)
             self.show_error(f"Could not open settings: {str(e)}")
     
     def apply_settings(self):
         """Applies the saved settings"""
-        settings = QSettings("BetterFinder", "BetterFinder")
+        settings = self.settings
         
         # Hotkey
         hotkey = settings.value("hotkey", "Strg+Leertaste")
@@ -932,20 +1557,15 @@ class MainWindow(QMainWindow):
         # Set the maximum number of results for the search
         
         # Excluded directories
-        excluded_paths = settings.value("excluded_paths", [], type=list)
+        excluded_paths = read_excluded_paths(settings)
         # Update the list of excluded directories in the indexer
         
         # Show notification
-        self.tray_icon.showMessage(
-            "BetterFinder", 
-            "Settings updated.", 
-            QSystemTrayIcon.Information, 
-            3000
-        )
+        self._notify("BetterFinder", "Settings updated.", QSystemTrayIcon.Information, 3000)
     
     def close_application(self):
         """Closes the application"""
-        self.save_settings()
+        self.unregister_global_hotkey()
         QApplication.quit()
     
     def closeEvent(self, event):
@@ -956,110 +1576,27 @@ class MainWindow(QMainWindow):
             event: Close event
         """
         # Minimize instead of closing if not explicitly ended
-        if self.tray_icon.isVisible():
+        if self._tray_visible:
             # Tray is visible, so minimize
             event.ignore()
             self.hide()
         else:
             # No tray, so normal close
-            self.save_settings()
+            self.unregister_global_hotkey()
             event.accept()
     
-    def save_settings(self):
-        """Saves the settings"""
-        # Settings could be saved here
-        pass
-    
-    def restore_settings(self):
-        """Restores the settings"""
-        # Settings could be restored here
-        pass
-    
-    def setup_autostart(self, enable):
-        """Configures autostart - ADDED FOR SETTINGS DIALOG"""
-        import os
-        import sys
-        import ctypes
+    def setup_autostart(self, enable, on_finished=None):
+        """
+        Configures autostart in the background - ADDED FOR SETTINGS DIALOG
         
-        try:
-            # Path to the executable
-            if getattr(sys, 'frozen', False):
-                # If the application was created with PyInstaller
-                app_path = sys.executable
-            else:
-                # If the application is run with Python
-                app_path = os.path.abspath(sys.argv[0])
-            
-            # Autostart directory
-            startup_dir = os.path.join(os.getenv('APPDATA'), 'Microsoft', 'Windows', 'Start Menu', 'Programs', 'Startup')
-            shortcut_path = os.path.join(startup_dir, 'BetterFinder.lnk')
-            bat_path = os.path.join(startup_dir, 'BetterFinder.bat')
-            
-            # Check if the directory exists and is writable
-            if not os.path.exists(startup_dir):
-                os.makedirs(startup_dir, exist_ok=True)
-                print(f"Autostart directory created: {startup_dir}")
-            
-            # Check if the directory is writable
-            if not os.access(startup_dir, os.W_OK):
-                raise Exception(f"No write permissions for the autostart directory: {startup_dir}")
-            
-            # Check if we have administrator rights (for UAC-protected folders)
-            def is_admin():
-                try:
-                    return ctypes.windll.shell32.IsUserAnAdmin()
-                except:
-                    return False
-            
-            if enable:
-                # Create a .bat file in the autostart directory
-                try:
-                    # Check if an existing file can be deleted
-                    if os.path.exists(bat_path) and not os.access(bat_path, os.W_OK):
-                        raise PermissionError(f"No write permissions for the existing file: {bat_path}")
-                        
-                    # Try to write the file
-                    try:
-                        with open(bat_path, 'w') as f:
-                            f.write(f'start "" "{app_path}"')
-                        print(f"Autostart file created successfully: {bat_path}")
-                    except PermissionError:
-                        if not is_admin():
-                            raise Exception("Not enough permissions. Try running the program as Administrator.")
-                        else:
-                            raise Exception(f"No write permissions for: {bat_path}")
-                    except IOError as e:
-                        raise Exception(f"IO error when writing file: {e}")
-                except Exception as e:
-                    raise Exception(f"Error creating autostart file: {e}")
-            else:
-                # Remove the file from the autostart directory
-                try:
-                    if os.path.exists(shortcut_path):
-                        try:
-                            os.remove(shortcut_path)
-                            print(f"Shortcut removed successfully: {shortcut_path}")
-                        except PermissionError:
-                            if not is_admin():
-                                raise Exception("Not enough permissions to remove the file. Try running the program as Administrator.")
-                            else:
-                                raise Exception(f"No delete permissions for: {shortcut_path}")
-                    
-                    if os.path.exists(bat_path):
-                        try:
-                            os.remove(bat_path)
-                            print(f"Batch file removed successfully: {bat_path}")
-                        except PermissionError:
-                            if not is_admin():
-                                raise Exception("Not enough permissions to remove the file. Try running the program as Administrator.")
-                            else:
-                                raise Exception(f"No delete permissions for: {bat_path}")
-                except Exception as e:
-                    raise Exception(f"Error removing autostart file: {e}")
-        except Exception as e:
-            # Pass all errors to a higher level
-            print(f"Autostart configuration failed: {e}")
-            raise
+        Args:
+            enable: True to create the autostart entry, False to remove it
+            on_finished: Optional slot receiving (success, error message)
+        """
+        worker = AutostartWorker(enable)
+        if on_finished is not None:
+            worker.signals.finished.connect(on_finished)
+        QThreadPool.globalInstance().start(worker)
 
 def main():
     """Main entry point for the application"""
@@ -1072,19 +1609,8 @@ def main():
     
     # Dark palette
     dark_palette = QPalette()
-    dark_palette.setColor(QPalette.Window, QColor(BACKGROUND_COLOR))
-    dark_palette.setColor(QPalette.WindowText, QColor(TEXT_COLOR))
-    dark_palette.setColor(QPalette.Base, QColor(BACKGROUND_SECONDARY))
-    dark_palette.setColor(QPalette.AlternateBase, QColor(BACKGROUND_COLOR))
-    dark_palette.setColor(QPalette.ToolTipBase, QColor(TEXT_COLOR))
-    dark_palette.setColor(QPalette.ToolTipText, QColor(TEXT_COLOR))
-    dark_palette.setColor(QPalette.Text, QColor(TEXT_COLOR))
-    dark_palette.setColor(QPalette.Button, QColor(BACKGROUND_SECONDARY))
-    dark_palette.setColor(QPalette.ButtonText, QColor(TEXT_COLOR))
-    dark_palette.setColor(QPalette.BrightText, Qt.red)
-    dark_palette.setColor(QPalette.Link, QColor(ACCENT_COLOR))
-    dark_palette.setColor(QPalette.Highlight, QColor(ACCENT_COLOR))
-    dark_palette.setColor(QPalette.HighlightedText, Qt.white)
+    for role, color in _DARK_PALETTE_COLORS:
+        dark_palette.setColor(role, color)
     
     app.setPalette(dark_palette)
     
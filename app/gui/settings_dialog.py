@@ -8,19 +8,84 @@ This module defines the settings dialog with options for:
 4. Maximum search results
 """
 
+import logging
+
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QCheckBox, QListWidget, QGroupBox, QSpinBox, QMessageBox, QFileDialog
 )
-from PyQt5.QtCore import Qt, QSettings
+from PyQt5.QtCore import QSettings, QTimer
+
+logger = logging.getLogger(__name__)
+
+EXCLUDED_PATHS_KEY = "excluded_paths"
+
+def read_excluded_paths(settings):
+    """Reads the excluded paths stored as a QSettings array"""
+    # Older versions stored the whole list as a single value
+    if settings.contains(EXCLUDED_PATHS_KEY):
+        return settings.value(EXCLUDED_PATHS_KEY, [], type=list)
+    
+    count = settings.beginReadArray(EXCLUDED_PATHS_KEY)
+    paths = []
+    for i in range(count):
+        settings.setArrayIndex(i)
+        paths.append(settings.value("path", "", type=str))
+    settings.endArray()
+    return paths
+
+def write_excluded_paths(settings, paths, stored_paths=None):
+    """
+    Writes the excluded paths as a QSettings array
+    
+    Appended paths are written as new array entries only, so adding a path
+    does not rewrite all existing entries.
+    
+    Returns:
+        True if anything was written, False if the paths were unchanged
+    """
+    if settings.contains(EXCLUDED_PATHS_KEY):
+        # Migrate the old single-value list
+        settings.remove(EXCLUDED_PATHS_KEY)
+        stored_paths = []
+    elif stored_paths is None:
+        stored_paths = read_excluded_paths(settings)
+    
+    if paths == stored_paths:
+        return False
+    
+    if paths[:len(stored_paths)] == stored_paths:
+        start = len(stored_paths)
+    else:
+        # Entries were removed or reordered, rewrite the whole array
+        settings.remove(EXCLUDED_PATHS_KEY)
+        start = 0
+    
+    settings.beginWriteArray(EXCLUDED_PATHS_KEY, len(paths))
+    for i in range(start, len(paths)):
+        settings.setArrayIndex(i)
+        settings.setValue("path", paths[i])
+    settings.endArray()
+    return True
 
 class SettingsDialog(QDialog):
     """Settings dialog for BetterFinder"""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, settings=None):
+        """
+        Initializes the settings dialog
+        
+        Args:
+            parent: The main window
+            settings: QSettings instance to use, defaults to the one of the main window
+        """
         super().__init__(parent)
         self.main_window = parent
-        self.settings = QSettings("BetterFinder", "BetterFinder")
+        if settings is None:
+            settings = getattr(parent, 'settings', None)
+        self.settings = settings if settings is not None else QSettings("BetterFinder", "BetterFinder")
+        # Paths in the exclude list, for duplicate checks without scanning the widget
+        self._excluded_set = set()
         self.setWindowTitle("BetterFinder Settings")
         self.resize(500, 400)
         self.init_ui()
@@ -100,53 +165,61 @@ class SettingsDialog(QDialog):
         autostart = self.settings.value("autostart", False, type=bool)
         self.autostart_checkbox.setChecked(autostart)
         
-        # Excluded directories
-        excluded_paths = self.settings.value("excluded_paths", [], type=list)
-        for path in excluded_paths:
-            self.exclude_list.addItem(path)
+        # Excluded directories are only filled in once the dialog is shown
+        self._excludes_loaded = False
+        if self.isVisible():
+            QTimer.singleShot(0, self._populate_exclude_list)
         
         # Maximum results
         max_results = self.settings.value("max_results", 30, type=int)
         self.max_results_spinbox.setValue(max_results)
     
+    def showEvent(self, event):
+        """Fills the excluded directories right after the dialog has been painted"""
+        super().showEvent(event)
+        QTimer.singleShot(0, self._populate_exclude_list)
+    
+    def _populate_exclude_list(self):
+        """Loads the excluded directories into the list once per settings load"""
+        if self._excludes_loaded:
+            return
+        paths = read_excluded_paths(self.settings)
+        self.exclude_list.clear()
+        self.exclude_list.addItems(paths)
+        self._excluded_set = set(paths)
+        self._excludes_loaded = True
+    
+    def reload_current_settings(self):
+        """Reloads the stored settings into the existing widgets"""
+        self.load_settings()
+    
     def save_settings(self):
         """Saves the settings and closes the dialog."""
         try:
             # Save hotkey
-            self.settings.setValue("hotkey", self.hotkey_edit.text())
+            changed = self._set_if_changed("hotkey", self.hotkey_edit.text())
             
             # Save autostart setting
             autostart = self.autostart_checkbox.isChecked()
-            self.settings.setValue("autostart", autostart)
-            
-            # Configure autostart
-            try:
-                self.main_window.setup_autostart(autostart)
-            except Exception as e:
-                QMessageBox.warning(
-                    self,
-                    "Autostart Error",
-                    f"Settings were saved, but autostart could not be configured:\n\n{str(e)}\n\n"
-                    "Possible solutions:\n"
-                    "- Run the program as administrator\n"
-                    "- Check permissions for the autostart folder\n"
-                    "- Disable the autostart option"
-                )
-                # Reset autostart setting
-                self.settings.setValue("autostart", False)
-                self.autostart_checkbox.setChecked(False)
+            if self._set_if_changed("autostart", autostart):
+                changed = True
+                # Configure autostart in the background, errors are reported afterwards
+                self.main_window.setup_autostart(autostart, self.on_autostart_finished)
             
-            # Save excluded paths
-            paths = []
-            for i in range(self.exclude_list.count()):
-                paths.append(self.exclude_list.item(i).text())
-            self.settings.setValue("excluded_paths", paths)
+            # Save excluded paths (the list may not have been filled yet)
+            self._populate_exclude_list()
+            item = self.exclude_list.item
+            paths = [item(i).text() for i in range(self.exclude_list.count())]
+            if write_excluded_paths(self.settings, paths):
+                changed = True
             
             # Save maximum results
-            self.settings.setValue("max_results", self.max_results_spinbox.value())
+            if self._set_if_changed("max_results", self.max_results_spinbox.value()):
+                changed = True
             
-            # Write settings to file
-            self.settings.sync()
+            # Write settings to file, but only if anything changed
+            if changed:
+                self.settings.sync()
             
             self.accept()
         except Exception as e:
@@ -155,28 +228,65 @@ class SettingsDialog(QDialog):
                 "Error Saving",
                 f"The settings could not be saved:\n\n{str(e)}"
             )
-            import traceback
-            traceback.print_exc()
+            logger.debug("Error saving settings", exc_info=True)
+    
+    def _set_if_changed(self, key, value):
+        """
+        Writes a setting only if its stored value differs
+        
+        Args:
+            key: Settings key
+            value: New value
+            
+        Returns:
+            True if the value was written
+        """
+        if self.settings.contains(key) and self.settings.value(key, type=type(value)) == value:
+            return False
+        self.settings.setValue(key, value)
+        return True
     
     def change_hotkey(self):
         """Changes the hotkey"""
         # In a real implementation, this would capture a key press
         self.hotkey_edit.setText("Ctrl+Space")
     
+    def on_autostart_finished(self, success, error_message):
+        """
+        Called when the autostart configuration is finished
+        
+        Args:
+            success: True if autostart was configured
+            error_message: Error message if it failed
+        """
+        if success:
+            return
+        QMessageBox.warning(
+            self,
+            "Autostart Error",
+            f"Settings were saved, but autostart could not be configured:\n\n{error_message}\n\n"
+            "Possible solutions:\n"
+            "- Run the program as administrator\n"
+            "- Check permissions for the autostart folder\n"
+            "- Disable the autostart option"
+        )
+        # Reset autostart setting
+        self.settings.setValue("autostart", False)
+        self.settings.sync()
+        self.autostart_checkbox.setChecked(False)
+    
     def add_exclude_path(self):
         """Adds an excluded path"""
         directory = QFileDialog.getExistingDirectory(self, "Select directory")
-        if directory:
-            # Check if the path is already in the list
-            for i in range(self.exclude_list.count()):
-                if self.exclude_list.item(i).text() == directory:
-                    return
-            
-            # Add the path to the list
+        self._populate_exclude_list()
+        # Skip paths that are already in the list
+        if directory and directory not in self._excluded_set:
+            self._excluded_set.add(directory)
             self.exclude_list.addItem(directory)
     
     def remove_exclude_path(self):
         """Removes a selected path"""
         selected_items = self.exclude_list.selectedItems()
         for item in selected_items:
+            self._excluded_set.discard(item.text())
             self.exclude_list.takeItem(self.exclude_list.row(item)) 
\ No newline at end of file
@@ -7,11 +7,20 @@ This module starts the application and initializes all required components.
 import sys
 import os
 import argparse
+import functools
+import logging
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import QTimer
 
+from app import DEBUG
 from app.gui.main_window import MainWindow
 
+logger = logging.getLogger(__name__)
+
+# Resources next to this module
+_RES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources")
+
 
 def parse_arguments():
     """
@@ -61,11 +70,12 @@ def run_command_line(args):
     return True
 
 
-def set_app_icon(app):
-    """Sets the application icon for the BetterFinder application"""
+@functools.lru_cache(maxsize=1)
+def _resolve_icon_path():
+    """Returns the first existing icon path, looked up only once per process"""
     icon_paths = [
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "icon.ico"),
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "BetterFinder-Icon.png")
+        os.path.join(_RES_DIR, "icon.ico"),
+        os.path.join(_RES_DIR, "BetterFinder-Icon.png")
     ]
     
     # If we are in a frozen PyInstaller application, the path is different
@@ -79,24 +89,35 @@ def set_app_icon(app):
             os.path.join(base_path, "resources", "BetterFinder-Icon.png")
         ])
     
-    # Try to load the icon from various possible paths
     for icon_path in icon_paths:
         if os.path.exists(icon_path):
-            try:
-                app.setWindowIcon(QIcon(icon_path))
-                print(f"Icon set from: {icon_path}")
-                return True
-            except Exception as e:
-                print(f"Error setting icon from {icon_path}: {e}")
+            return icon_path
+    return None
+
+
+def set_app_icon(app):
+    """Sets the application icon for the BetterFinder application"""
+    icon_path = _resolve_icon_path()
+    if icon_path is None:
+        logger.warning("No valid icon found")
+        return False
     
-    print("Warning: No valid icon found")
-    return False
+    try:
+        app.setWindowIcon(QIcon(icon_path))
+        logger.debug("Icon set from: %s", icon_path)
+        return True
+    except Exception as e:
+        logger.warning("Error setting icon from %s: %s", icon_path, e)
+        return False
 
 
 def main():
     """
     Main entry point
     """
+    # Debug output only with BETTERFINDER_DEBUG=1
+    logging.basicConfig(level=logging.DEBUG if DEBUG else logging.WARNING)
+    
     # Parse command line arguments
     args = parse_arguments()
     
@@ -112,8 +133,9 @@ def main():
         # Set the application icon
         set_app_icon(app)
         
-        # Create main window (with tray icon, no visible window)
-        window = MainWindow()
+        # Create main window (with tray icon, no visible window) once the event loop runs
+        windows = []
+        QTimer.singleShot(0, lambda: windows.append(MainWindow()))
         
         # Run application
         sys.exit(app.exec_())
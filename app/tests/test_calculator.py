@@ -0,0 +1,34 @@
+"""
+Tests for the "=" calculator of the spotlight window
+"""
+
+import unittest
+
+from app.gui.main_window import _calc, _CALC_MAX_LENGTH
+
+
+class CalculatorTest(unittest.TestCase):
+    """Tests for _calc"""
+    
+    def test_basic_arithmetic(self):
+        self.assertEqual(_calc("2+3*4"), 14)
+        self.assertAlmostEqual(_calc("sqrt(16) + pi"), 4 + 3.141592653589793)
+    
+    def test_rejects_names_outside_whitelist(self):
+        with self.assertRaises(ValueError):
+            _calc("__import__('os')")
+    
+    def test_rejects_huge_powers(self):
+        with self.assertRaises(ValueError):
+            _calc("9**9**9")
+    
+    def test_rejects_deeply_nested_input(self):
+        # ast.parse raises MemoryError for input like this, which must not reach the parser
+        expression = "**".join(["1"] * 3000)
+        self.assertGreater(len(expression), _CALC_MAX_LENGTH)
+        with self.assertRaises(ValueError):
+            _calc(expression)
+
+
+if __name__ == "__main__":
+    unittest.main()
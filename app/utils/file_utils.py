@@ -9,14 +9,39 @@ Dieses Modul enthält Hilfsfunktionen für:
 """
 
 import os
+import stat
+import shutil
+import functools
 import subprocess
 import platform
-from datetime import datetime
-from typing import Union, Optional
+import time
+from typing import Iterable, List, Union, Optional
 
-def get_file_size_str(size_bytes: int) -> str:
+# Betriebssystem einmalig beim Import bestimmen
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == 'Windows'
+_IS_MACOS = _SYSTEM == 'Darwin'
+
+# Größeneinheiten für get_file_size_str
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_DOT_TO_COMMA = str.maketrans(".", ",")
+
+if _IS_WINDOWS:
+    import ctypes
+    
+    # Direkter Aufruf der Kernel-Funktion, ohne pywin32; eigenes Handle, damit der
+    # Prototyp nicht das prozessweite ctypes.windll.kernel32 verändert
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _GetFileAttributesW = _kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = [ctypes.c_wchar_p]
+    _GetFileAttributesW.restype = ctypes.c_uint32
+    
+    _INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+    _FILE_ATTRIBUTE_HIDDEN = 0x2
+
+def _format_size(size_bytes: int) -> str:
     """
-    Formatiert eine Dateigröße in Bytes zu einer lesbaren Größe
+    Formatiert eine einzelne Dateigröße (gemeinsame Implementierung)
     
     Args:
         size_bytes: Größe in Bytes
@@ -24,26 +49,40 @@ def get_file_size_str(size_bytes: int) -> str:
     Returns:
         Formatierte Größe als String (z.B. "1,5 MB")
     """
-    # Für 0 Byte
-    if size_bytes == 0:
-        return "0 B"
+    # Bytes (auch 0) ohne Dezimalstellen
+    if size_bytes < 1024:
+        return f"{size_bytes:.0f} B"
     
-    # Größeneinheiten
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
+    # Einheit über die Bitlänge bestimmen: jede Einheit entspricht 10 Bit
+    unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    value = size_bytes / (1 << (unit_index * 10))
     
-    # Einheit bestimmen
-    unit_index = 0
-    while size_bytes >= 1024 and unit_index < len(units) - 1:
-        size_bytes /= 1024
-        unit_index += 1
+    # Eine Dezimalstelle mit Komma für größere Einheiten
+    return f"{value:.1f}".translate(_DOT_TO_COMMA) + " " + _SIZE_UNITS[unit_index]
+
+def get_file_size_str(size_bytes: int) -> str:
+    """
+    Formatiert eine Dateigröße in Bytes zu einer lesbaren Größe
     
-    # Formatierung
-    if unit_index == 0:
-        # Keine Dezimalstellen für Bytes
-        return f"{size_bytes:.0f} {units[unit_index]}"
-    else:
-        # Eine Dezimalstelle für größere Einheiten
-        return f"{size_bytes:.1f} {units[unit_index]}".replace(".", ",")
+    Args:
+        size_bytes: Größe in Bytes
+        
+    Returns:
+        Formatierte Größe als String (z.B. "1,5 MB")
+    """
+    return _format_size(size_bytes)
+
+def get_file_size_strs(sizes: Iterable[int]) -> List[str]:
+    """
+    Formatiert mehrere Dateigrößen in Bytes zu lesbaren Größen
+    
+    Args:
+        sizes: Größen in Bytes
+        
+    Returns:
+        Formatierte Größen als Strings (z.B. "1,5 MB")
+    """
+    return list(map(_format_size, sizes))
 
 def get_file_date_str(timestamp: Union[int, float]) -> str:
     """
@@ -55,8 +94,74 @@ def get_file_date_str(timestamp: Union[int, float]) -> str:
     Returns:
         Formatiertes Datum als String (z.B. "25.04.2023 14:30")
     """
-    dt = datetime.fromtimestamp(timestamp)
-    return dt.strftime("%d.%m.%Y %H:%M")
+    return get_file_date_strs((timestamp,))[0]
+
+def get_file_date_strs(timestamps: Iterable[Union[int, float]]) -> List[str]:
+    """
+    Formatiert mehrere Unix-Zeitstempel zu lesbaren Daten
+    
+    Verwendet time.localtime und ein festes Format statt datetime und strftime,
+    da dies für viele Zeilen deutlich schneller ist.
+    
+    Args:
+        timestamps: Unix-Zeitstempel
+        
+    Returns:
+        Formatierte Daten als Strings (z.B. "25.04.2023 14:30")
+    """
+    localtime = time.localtime
+    result = []
+    append = result.append
+    for timestamp in timestamps:
+        t = localtime(timestamp)
+        append(f"{t.tm_mday:02d}.{t.tm_mon:02d}.{t.tm_year:04d} {t.tm_hour:02d}:{t.tm_min:02d}")
+    return result
+
+def _launch(cmd: List[str]):
+    """
+    Startet ein Programm, ohne auf dessen Ende zu warten
+    
+    Args:
+        cmd: Programm und Argumente
+    """
+    if _IS_WINDOWS:
+        subprocess.Popen(cmd, close_fds=True, creationflags=subprocess.DETACHED_PROCESS)
+    else:
+        # Mit absolutem Programmpfad und close_fds=False kann subprocess direkt
+        # posix_spawn verwenden; die Argumente werden nur einmal kodiert
+        args = [os.fsencode(_resolve_program(cmd[0]))]
+        args.extend(os.fsencode(arg) for arg in cmd[1:])
+        subprocess.Popen(args, close_fds=False, stdin=subprocess.DEVNULL,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+@functools.lru_cache(maxsize=None)
+def _resolve_program(name: str) -> str:
+    """
+    Ermittelt den absoluten Pfad eines Programms im PATH (zwischengespeichert)
+    
+    Args:
+        name: Programmname, z.B. "xdg-open"
+        
+    Returns:
+        Absoluter Pfad oder der unveränderte Name, wenn das Programm nicht gefunden wurde
+    """
+    return shutil.which(name) or name
+
+def _path_exists(file_path: str) -> bool:
+    """
+    Prüft mit einem einzigen Kernel-Aufruf, ob ein Pfad existiert
+    
+    Unter Windows genügt GetFileAttributesW, ein vollständiges stat ist nicht nötig.
+    
+    Args:
+        file_path: Zu prüfender Pfad
+        
+    Returns:
+        True, wenn der Pfad existiert, sonst False
+    """
+    if _IS_WINDOWS:
+        return _GetFileAttributesW(file_path) != _INVALID_FILE_ATTRIBUTES
+    return os.path.exists(file_path)
 
 def open_file(file_path: str) -> bool:
     """
@@ -68,16 +173,18 @@ def open_file(file_path: str) -> bool:
     Returns:
         True bei Erfolg, False bei Fehler
     """
-    if not os.path.exists(file_path):
-        return False
-    
     try:
-        if platform.system() == 'Windows':
+        if _IS_WINDOWS:
+            # os.startfile meldet einen fehlenden Pfad selbst, eine Vorabprüfung entfällt
             os.startfile(file_path)
-        elif platform.system() == 'Darwin':  # macOS
-            subprocess.call(['open', file_path])
-        else:  # Linux und andere
-            subprocess.call(['xdg-open', file_path])
+        else:
+            # Der Opener läuft ohne Warten, Fehler kämen hier nicht mehr an
+            if not _path_exists(file_path):
+                return False
+            if _IS_MACOS:  # macOS
+                _launch(['open', file_path])
+            else:  # Linux und andere
+                _launch(['xdg-open', file_path])
         return True
     except Exception:
         return False
@@ -92,48 +199,67 @@ def open_containing_folder(file_path: str) -> bool:
     Returns:
         True bei Erfolg, False bei Fehler
     """
-    if not os.path.exists(file_path):
+    # Der Opener läuft ohne Warten, daher bleibt hier eine (günstige) Existenzprüfung
+    if not _path_exists(file_path):
         return False
     
     try:
         folder_path = os.path.dirname(file_path)
         
-        if platform.system() == 'Windows':
+        if _IS_WINDOWS:
             # Ordner im Explorer öffnen und Datei auswählen
-            subprocess.call(['explorer', '/select,', file_path])
-        elif platform.system() == 'Darwin':  # macOS
+            _launch(['explorer', '/select,', file_path])
+        elif _IS_MACOS:  # macOS
             # Ordner im Finder öffnen
-            subprocess.call(['open', folder_path])
+            _launch(['open', folder_path])
         else:  # Linux und andere
             # Ordner im Dateimanager öffnen
-            subprocess.call(['xdg-open', folder_path])
+            _launch(['xdg-open', folder_path])
         return True
     except Exception:
         return False
 
-def is_hidden_file(file_path: str) -> bool:
+def is_hidden_file(file_path: str, stat_result: Optional[os.stat_result] = None) -> bool:
     """
     Prüft, ob eine Datei versteckt ist
     
     Args:
         file_path: Pfad zur Datei
+        stat_result: Optionales, bereits ermitteltes os.stat-Ergebnis der Datei;
+                     unter Windows spart es den zusätzlichen Kernel-Aufruf
         
     Returns:
         True, wenn die Datei versteckt ist, sonst False
     """
-    if platform.system() == 'Windows':
-        import win32api
-        import win32con
-        
-        try:
-            attrs = win32api.GetFileAttributes(file_path)
-            return bool(attrs & win32con.FILE_ATTRIBUTE_HIDDEN)
-        except:
-            return False
+    if _IS_WINDOWS:
+        if stat_result is not None and hasattr(stat_result, 'st_file_attributes'):
+            return bool(stat_result.st_file_attributes & stat.FILE_ATTRIBUTE_HIDDEN)
+        attrs = _GetFileAttributesW(file_path)
+        return attrs != _INVALID_FILE_ATTRIBUTES and bool(attrs & _FILE_ATTRIBUTE_HIDDEN)
     else:
         # Unter Unix/Linux sind Dateien mit vorangestelltem Punkt versteckt
         return os.path.basename(file_path).startswith('.')
 
+def is_hidden_entry(entry: os.DirEntry) -> bool:
+    """
+    Prüft, ob ein Verzeichniseintrag aus os.scandir versteckt ist
+    
+    Unter Windows liefert scandir die Dateiattribute bereits mit, entry.stat()
+    benötigt daher keinen weiteren Kernel-Aufruf. Unter Unix/Linux genügt der Name.
+    
+    Args:
+        entry: Eintrag aus os.scandir
+        
+    Returns:
+        True, wenn der Eintrag versteckt ist, sonst False
+    """
+    if _IS_WINDOWS:
+        try:
+            return is_hidden_file(entry.path, entry.stat(follow_symlinks=False))
+        except OSError:
+            return False
+    return entry.name.startswith('.')
+
 def get_file_type_icon(file_path: str) -> Optional[str]:
     """
     Gibt den Pfad zu einem passenden Icon für den Dateityp zurück
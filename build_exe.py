@@ -11,8 +11,12 @@ It handles:
 import os
 import sys
 import shutil
+import time
+import ctypes
+import hashlib
 import subprocess
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 def print_header(text):
     """Prints a formatted header text"""
@@ -20,48 +24,180 @@ def print_header(text):
     print(text)
     print("=" * 30)
 
+class _PROCESSENTRY32W(ctypes.Structure):
+    """Process entry as returned by Process32FirstW/Process32NextW"""
+    _fields_ = [
+        ("dwSize", ctypes.c_uint32),
+        ("cntUsage", ctypes.c_uint32),
+        ("th32ProcessID", ctypes.c_uint32),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", ctypes.c_uint32),
+        ("cntThreads", ctypes.c_uint32),
+        ("th32ParentProcessID", ctypes.c_uint32),
+        ("pcPriClassBase", ctypes.c_long),
+        ("dwFlags", ctypes.c_uint32),
+        ("szExeFile", ctypes.c_wchar * 260),
+    ]
+
+TH32CS_SNAPPROCESS = 0x00000002
+PROCESS_TERMINATE = 0x0001
+SYNCHRONIZE = 0x00100000
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+def find_process_ids(process_name):
+    """Returns the IDs of all running processes with the given image name"""
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateToolhelp32Snapshot.restype = ctypes.c_void_p
+    kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+    kernel32.Process32FirstW.argtypes = [ctypes.c_void_p, ctypes.POINTER(_PROCESSENTRY32W)]
+    kernel32.Process32NextW.argtypes = [ctypes.c_void_p, ctypes.POINTER(_PROCESSENTRY32W)]
+    
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot in (None, INVALID_HANDLE_VALUE):
+        raise ctypes.WinError(ctypes.get_last_error())
+    
+    pids = []
+    target = process_name.lower()
+    try:
+        entry = _PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(entry)
+        more = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while more:
+            if entry.szExeFile.lower() == target:
+                pids.append(entry.th32ProcessID)
+            more = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+    return pids
+
 def is_process_running(process_name):
     """Checks if a process with the given name is running"""
     try:
-        # Windows method using tasklist
-        result = subprocess.run(
-            f'tasklist /FI "IMAGENAME eq {process_name}" /NH', 
-            shell=True, 
-            capture_output=True, 
-            text=True
-        )
-        return process_name.lower() in result.stdout.lower()
+        return bool(find_process_ids(process_name))
     except Exception as e:
         print(f"Error checking for running process: {e}")
         return False
 
-def terminate_process(process_name):
-    """Tries to terminate a process with the given name"""
+def terminate_process(process_name, pids=None):
+    """Tries to terminate all processes with the given name
+    
+    Args:
+        process_name: Image name of the process, e.g. "BetterFinder.exe"
+        pids: Process IDs already looked up with find_process_ids, if any
+    """
     try:
-        subprocess.run(f'taskkill /F /IM {process_name}', shell=True)
+        if pids is None:
+            pids = find_process_ids(process_name)
+        
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.OpenProcess.restype = ctypes.c_void_p
+        kernel32.TerminateProcess.argtypes = [ctypes.c_void_p, ctypes.c_uint]
+        kernel32.WaitForSingleObject.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
+        kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+        
+        handles = []
+        for pid in pids:
+            handle = kernel32.OpenProcess(PROCESS_TERMINATE | SYNCHRONIZE, False, pid)
+            if not handle:
+                print(f"Could not open process {pid}: {ctypes.WinError(ctypes.get_last_error())}")
+                continue
+            kernel32.TerminateProcess(handle, 1)
+            handles.append(handle)
+        
+        # Wait until the processes are gone so their files are no longer locked
+        for handle in handles:
+            kernel32.WaitForSingleObject(handle, 2000)
+            kernel32.CloseHandle(handle)
+        
         print(f"Terminated {process_name}")
-        return True
+        return bool(handles)
     except Exception as e:
         print(f"Error terminating process: {e}")
         return False
 
+def _remove_directory(directory, retries=3, delay=0.05):
+    """Removes a single build directory, returns the error if it fails
+    
+    Files of a just terminated BetterFinder.exe may still be locked for a
+    moment on Windows, so failed attempts are retried with exponential backoff.
+    """
+    print(f"Removing existing {directory} directory...")
+    for attempt in range(retries + 1):
+        try:
+            shutil.rmtree(directory)
+            return None
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            if attempt == retries:
+                return e
+            time.sleep(delay * (2 ** attempt))
+        except Exception as e:
+            return e
+
 def clean_build_directories():
-    """Removes previous build directories"""
-    directories = ['build', 'dist']
-    for directory in directories:
-        if os.path.exists(directory):
-            try:
-                print(f"Removing existing {directory} directory...")
-                shutil.rmtree(directory)
-            except Exception as e:
-                print(f"Error removing {directory}: {e}")
-                traceback.print_exc()
-                return False
-    return True
+    """Removes previous build directories
+    
+    build/ and dist/ are deleted concurrently, since both are I/O-bound.
+    """
+    directories = [d for d in ('build', 'dist') if os.path.exists(d)]
+    if not directories:
+        return True
+    
+    with ThreadPoolExecutor(max_workers=len(directories)) as executor:
+        errors = list(executor.map(_remove_directory, directories))
+    
+    success = True
+    for directory, error in zip(directories, errors):
+        if error is not None:
+            print(f"Error removing {directory}: {error}")
+            traceback.print_exception(type(error), error, error.__traceback__)
+            success = False
+    return success
+
+SPEC_FILE = "BetterFinder.spec"
+SOURCES_HASH_FILE = ".spec_sources_hash"
+
+def compute_sources_hash(build_cmd):
+    """Computes a hash over all Python sources under app/ and the build options
+    
+    Args:
+        build_cmd: PyInstaller command of a full build, see full_build_command
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\0".join(build_cmd).encode("utf-8") + b"\0\0")
+    
+    source_files = []
+    for root, dirs, files in os.walk("app"):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        source_files.extend(os.path.join(root, f) for f in files if f.endswith(".py"))
+    
+    for path in sorted(source_files):
+        digest.update(path.encode("utf-8") + b"\0")
+        with open(path, "rb") as f:
+            digest.update(f.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def read_sources_hash():
+    """Returns the sources hash stored by the last full build, if any"""
+    try:
+        with open(SOURCES_HASH_FILE, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def write_sources_hash(sources_hash):
+    """Stores the sources hash of a successful full build"""
+    try:
+        with open(SOURCES_HASH_FILE, "w", encoding="utf-8") as f:
+            f.write(sources_hash)
+    except OSError as e:
+        print(f"Error writing {SOURCES_HASH_FILE}: {e}")
 
 def clean_spec_file():
     """Removes previous spec file"""
-    spec_file = "BetterFinder.spec"
+    spec_file = SPEC_FILE
     if os.path.exists(spec_file):
         try:
             os.remove(spec_file)
@@ -87,17 +223,21 @@ def clean_exe_file():
 
 def find_icon():
     """Finds the icon file for the application"""
-    icon_paths = [
-        os.path.join("app", "resources", "icon.ico"),
-        os.path.join("app", "resources", "BetterFinder-Icon.ico"),
-        "icon.ico",
-        "BetterFinder-Icon.ico"
-    ]
+    resources_dir = os.path.join("app", "resources")
+    icon_names = ["icon.ico", "BetterFinder-Icon.ico"]
     
-    for path in icon_paths:
-        if os.path.exists(path):
-            print(f"Using icon: {path}")
-            return path
+    # List each candidate directory once instead of probing every path separately
+    for directory in (resources_dir, "."):
+        try:
+            with os.scandir(directory) as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            continue
+        for name in icon_names:
+            if name in present:
+                path = os.path.join(directory, name) if directory != "." else name
+                print(f"Using icon: {path}")
+                return path
     
     # If no icon found, try to create one
     try:
@@ -115,67 +255,93 @@ def find_icon():
     print("Warning: No icon found. Using default PyInstaller icon.")
     return None
 
-def build_executable(icon_path=None):
-    """Builds the executable using PyInstaller"""
+def full_build_command(icon_path=None):
+    """Returns the PyInstaller command for a full build from scratch"""
+    # Base command
+    cmd = [
+        "pyinstaller",
+        "--name=BetterFinder",
+        "--onefile",
+        "--windowed",
+        "--clean",
+        "--noconfirm",
+        "--add-data=app/resources;app/resources"
+    ]
+    
+    # Add icon if available
+    if icon_path:
+        cmd.append(f"--icon={icon_path}")
+    
+    # Add main script
+    cmd.append("app/main.py")
+    return cmd
+
+def build_executable(build_cmd, spec_file=None):
+    """Builds the executable using PyInstaller
+    
+    Args:
+        build_cmd: PyInstaller command of a full build, see full_build_command
+        spec_file: Existing spec file to rebuild from; PyInstaller then reuses
+                   its analysis cache instead of starting from scratch
+    """
     try:
-        # Base command
-        cmd = [
-            "pyinstaller",
-            "--name=BetterFinder",
-            "--onefile",
-            "--windowed",
-            "--clean",
-            "--noconfirm",
-            "--add-data=app/resources;app/resources"
-        ]
-        
-        # Add icon if available
-        if icon_path:
-            cmd.append(f"--icon={icon_path}")
-        
-        # Add main script
-        cmd.append("app/main.py")
-        
-        # Convert command to string for printing
-        cmd_str = " ".join(cmd)
-        print("Starting PyInstaller...")
-        print(f"Command: {cmd_str}")
-        
-        # Run the command
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        # Print output
-        print(result.stdout)
-        
-        if result.stderr:
-            print("Errors/Warnings:")
-            print(result.stderr)
-        
-        if result.returncode != 0:
-            print(f"PyInstaller failed with code {result.returncode}")
-            return False
-        
-        return True
+        if spec_file:
+            return run_pyinstaller(["pyinstaller", "--noconfirm", spec_file])
+        return run_pyinstaller(build_cmd)
     except Exception as e:
         print(f"Error building executable: {e}")
         traceback.print_exc()
         return False
 
+def run_pyinstaller(cmd):
+    """Runs the given PyInstaller command and reports whether it succeeded"""
+    # Convert command to string for printing
+    cmd_str = " ".join(cmd)
+    print("Starting PyInstaller...")
+    print(f"Command: {cmd_str}")
+    
+    # Run the command, PyInstaller writes its output directly to our console
+    sys.stdout.flush()
+    result = subprocess.run(cmd)
+    
+    if result.returncode != 0:
+        print(f"PyInstaller failed with code {result.returncode}")
+        return False
+    
+    return True
+
 def copy_executable():
-    """Copies the executable from the dist directory to the current directory"""
+    """Copies the executable from the dist directory to the current directory
+    
+    The executable is moved and then hard-linked back into dist, so both
+    locations share the same file instead of writing the binary a second time.
+    Falls back to a real copy if the two locations cannot share a file.
+    """
     source = os.path.join("dist", "BetterFinder.exe")
     destination = "BetterFinder.exe"
     
-    if os.path.exists(source):
+    try:
+        os.replace(source, destination)
+    except FileNotFoundError:
+        print(f"Error: {source} not found")
+        return False
+    except OSError:
+        # Different volume or locked destination, copy the file instead
         try:
             shutil.copy2(source, destination)
             return True
         except Exception as e:
             print(f"Error copying executable: {e}")
             return False
-    else:
-        print(f"Error: {source} not found")
-        return False
+    
+    try:
+        os.link(destination, source)
+    except OSError:
+        try:
+            shutil.copy2(destination, source)
+        except Exception as e:
+            print(f"Error restoring {source}: {e}")
+    return True
 
 def main():
     """Main function to build the executable"""
@@ -183,25 +349,41 @@ def main():
     
     # Check for running processes
     process_name = "BetterFinder.exe"
-    if is_process_running(process_name):
+    try:
+        pids = find_process_ids(process_name)
+    except Exception as e:
+        print(f"Error checking for running process: {e}")
+        pids = []
+    if pids:
         print(f"Trying to terminate running {process_name} processes...")
-        terminate_process(process_name)
+        terminate_process(process_name, pids)
     
-    # Clean up previous build files
-    if not clean_build_directories():
-        print("Error cleaning build directories. Continuing anyway...")
+    # Find icon
+    icon_path = find_icon()
+    
+    # Reuse the existing spec and build cache if the sources and options did not change
+    build_cmd = full_build_command(icon_path)
+    sources_hash = compute_sources_hash(build_cmd)
+    incremental = os.path.exists(SPEC_FILE) and read_sources_hash() == sources_hash
     
-    if not clean_spec_file():
-        print("Error cleaning spec file. Continuing anyway...")
+    if incremental:
+        print(f"Sources unchanged, rebuilding from {SPEC_FILE}...")
+    else:
+        # Clean up previous build files
+        if not clean_build_directories():
+            print("Error cleaning build directories. Continuing anyway...")
+        
+        if not clean_spec_file():
+            print("Error cleaning spec file. Continuing anyway...")
     
     if not clean_exe_file():
         print("Error cleaning executable. Continuing anyway...")
     
-    # Find icon
-    icon_path = find_icon()
-    
     # Build the executable
-    if build_executable(icon_path):
+    if build_executable(build_cmd, SPEC_FILE if incremental else None):
+        if not incremental:
+            write_sources_hash(sources_hash)
+        
         # Copy the executable to the current directory
         if copy_executable():
             print("\nBuild completed successfully!")
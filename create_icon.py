@@ -1,5 +1,9 @@
 import os
-from PIL import Image
+import mmap
+from PIL import Image, ImageOps
+
+# Source images from this size on are read via mmap
+MMAP_THRESHOLD = 64 * 1024
 
 def create_icon_from_png(png_path, ico_path):
     """
@@ -16,14 +20,33 @@ def create_icon_from_png(png_path, ico_path):
         return False
     
     try:
-        # Open the image
-        img = Image.open(png_path)
+        # Open the image; large files are memory-mapped and decoded straight
+        # from the mapping instead of being read through a file buffer
+        if os.path.getsize(png_path) >= MMAP_THRESHOLD:
+            with open(png_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                img = Image.open(mm)
+                img.load()
+        else:
+            img = Image.open(png_path)
+        
+        # Create the sizes Windows actually uses (small, medium, large and jumbo icons)
+        icon_sizes = [(16, 16), (32, 32), (48, 48), (256, 256)]
+        
+        # Resample the (possibly large) source only once: fit it into the largest
+        # size, keeping its aspect ratio, and center it on a transparent square
+        largest = icon_sizes[-1]
+        fitted = ImageOps.contain(img.convert('RGBA'), largest, Image.LANCZOS)
+        current = Image.new('RGBA', largest, (0, 0, 0, 0))
+        current.paste(fitted, ((largest[0] - fitted.width) // 2, (largest[1] - fitted.height) // 2))
         
-        # Create versions in different sizes for a complete icon
-        icon_sizes = [(16, 16), (24, 24), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
+        # Derive every smaller size from the previous (square) frame
+        frames = [current]
+        for size in reversed(icon_sizes[:-1]):
+            current = current.resize(size, Image.LANCZOS)
+            frames.append(current)
         
-        # Save as ICO with different sizes
-        img.save(ico_path, format='ICO', sizes=icon_sizes)
+        # Save as ICO with different sizes, using the prepared frames
+        frames[0].save(ico_path, format='ICO', sizes=icon_sizes, append_images=frames[1:])
         
         print(f"Icon successfully created: {ico_path}")
         
@@ -77,7 +77,7 @@ echo Aktualisiere pip...
 python -m pip install --upgrade pip
 
 :: Bereinige alte Datenbank-Dateien
-set DB_PATH=%USERPROFILE%\BetterFinder
+set DB_PATH=%APPDATA%\BetterFinder\BetterFinder
 echo Pruefe alte Datenbankdateien in %DB_PATH%...
 if not exist "%DB_PATH%" (
     mkdir "%DB_PATH%"
@@ -49,7 +49,7 @@ if %errorlevel% neq 0 (
 
 :: Check if old database is locked and clean up if necessary
 echo Checking old database files...
-set DB_PATH=%USERPROFILE%\BetterFinder
+set DB_PATH=%APPDATA%\BetterFinder\BetterFinder
 if exist "%DB_PATH%\index.db" (
     echo Ensuring database is not locked...
     :: Try to delete the WAL file if it exists
@@ -94,9 +94,9 @@ if %errorlevel% neq 0 (
     echo 1. Make sure no other instance of BetterFinder is running.
     echo 2. For database problems, try:
     echo    a) Remove the database file:
-    echo       del "%USERPROFILE%\BetterFinder\index.db"
+    echo       del "%DB_PATH%\index.db"
     echo    b) Restore the backup (if available):
-    echo       copy "%USERPROFILE%\BetterFinder\index.db.bak" "%USERPROFILE%\BetterFinder\index.db"
+    echo       copy "%DB_PATH%\index.db.bak" "%DB_PATH%\index.db"
     echo 3. Run 'installer.bat' again to update all components.
     echo.
     